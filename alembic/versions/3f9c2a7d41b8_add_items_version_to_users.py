@@ -0,0 +1,28 @@
+"""add items_version to users
+
+Revision ID: 3f9c2a7d41b8
+Revises: 12d60b205af2
+Create Date: 2026-10-19 09:12:40.118204
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from typing import Sequence, Union
+
+
+revision: str = "3f9c2a7d41b8"
+down_revision: Union[str, Sequence[str], None] = "12d60b205af2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    op.add_column(
+        "users",
+        sa.Column("items_version", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade():
+    op.drop_column("users", "items_version")
@@ -0,0 +1,28 @@
+"""add items_updated_at to users
+
+Revision ID: 5d7a9e3c1b24
+Revises: 8b1e4c6d2f90
+Create Date: 2026-10-19 13:41:09.274518
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from typing import Sequence, Union
+
+
+revision: str = "5d7a9e3c1b24"
+down_revision: Union[str, Sequence[str], None] = "8b1e4c6d2f90"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    op.add_column(
+        "users",
+        sa.Column("items_updated_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade():
+    op.drop_column("users", "items_updated_at")
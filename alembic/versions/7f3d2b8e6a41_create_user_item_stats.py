@@ -0,0 +1,53 @@
+"""create user_item_stats
+
+Creates the per-user collection summary and backfills it from the
+existing items; the newest item's creation time stands in for the last
+scrape.
+
+Revision ID: 7f3d2b8e6a41
+Revises: e2b7d5a90c13
+Create Date: 2026-10-19 18:05:12.740318
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from typing import Sequence, Union
+
+
+revision: str = "7f3d2b8e6a41"
+down_revision: Union[str, Sequence[str], None] = "e2b7d5a90c13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    op.create_table(
+        "user_item_stats",
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("item_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column(
+            "description_bytes", sa.BigInteger(), server_default="0", nullable=False
+        ),
+        sa.Column("last_scraped_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_scrape_inserted", sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+    op.execute(
+        """
+        INSERT INTO user_item_stats
+            (user_id, item_count, description_bytes, last_scraped_at)
+        SELECT owner_id,
+               count(*),
+               coalesce(sum(octet_length(description)), 0),
+               max(created_at)
+        FROM scraped_items
+        GROUP BY owner_id
+        """
+    )
+
+
+def downgrade():
+    op.drop_table("user_item_stats")
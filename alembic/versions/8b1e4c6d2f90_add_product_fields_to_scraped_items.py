@@ -0,0 +1,48 @@
+"""add product fields to scraped_items
+
+Revision ID: 8b1e4c6d2f90
+Revises: 3f9c2a7d41b8
+Create Date: 2026-10-19 11:03:27.552961
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from typing import Sequence, Union
+
+
+revision: str = "8b1e4c6d2f90"
+down_revision: Union[str, Sequence[str], None] = "3f9c2a7d41b8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    op.add_column("scraped_items", sa.Column("price", sa.Numeric(10, 2), nullable=True))
+    op.add_column("scraped_items", sa.Column("stock", sa.Integer(), nullable=True))
+    op.add_column("scraped_items", sa.Column("rating", sa.SmallInteger(), nullable=True))
+    op.add_column("scraped_items", sa.Column("upc", sa.String(length=32), nullable=True))
+    op.add_column("scraped_items", sa.Column("category", sa.String(), nullable=True))
+
+    op.create_index(
+        "ix_scraped_items_owner_price", "scraped_items", ["owner_id", "price"]
+    )
+    op.create_index(
+        "ix_scraped_items_owner_rating", "scraped_items", ["owner_id", "rating"]
+    )
+    op.create_index(
+        "ix_scraped_items_owner_category_price",
+        "scraped_items",
+        ["owner_id", "category", "price"],
+    )
+
+
+def downgrade():
+    op.drop_index("ix_scraped_items_owner_category_price", table_name="scraped_items")
+    op.drop_index("ix_scraped_items_owner_rating", table_name="scraped_items")
+    op.drop_index("ix_scraped_items_owner_price", table_name="scraped_items")
+    op.drop_column("scraped_items", "category")
+    op.drop_column("scraped_items", "upc")
+    op.drop_column("scraped_items", "rating")
+    op.drop_column("scraped_items", "stock")
+    op.drop_column("scraped_items", "price")
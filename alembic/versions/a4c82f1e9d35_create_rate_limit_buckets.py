@@ -0,0 +1,38 @@
+"""create rate_limit_buckets
+
+Revision ID: a4c82f1e9d35
+Revises: 5d7a9e3c1b24
+Create Date: 2026-10-19 15:20:51.806377
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from typing import Sequence, Union
+
+
+revision: str = "a4c82f1e9d35"
+down_revision: Union[str, Sequence[str], None] = "5d7a9e3c1b24"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    op.create_table(
+        "rate_limit_buckets",
+        sa.Column("key", sa.String(), nullable=False),
+        sa.Column("tokens", sa.Float(), nullable=False),
+        sa.Column("allowed", sa.Boolean(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("key"),
+        prefixes=["UNLOGGED"],
+    )
+
+
+def downgrade():
+    op.drop_table("rate_limit_buckets")
@@ -0,0 +1,43 @@
+"""tune scraped_items indexes
+
+Drops the index duplicating the primary key and the global unique
+constraint on url (items are unique per owner via uq_owner_url), and adds
+(owner_id, created_at, id) so the default item listing is an index scan
+instead of a sort of the owner's rows.
+
+Downgrading recreates the global url constraint and fails if two users
+own the same URL.
+
+Revision ID: c6e1f08b7a52
+Revises: a4c82f1e9d35
+Create Date: 2026-10-19 16:42:08.519304
+
+"""
+
+from alembic import op
+from typing import Sequence, Union
+
+
+revision: str = "c6e1f08b7a52"
+down_revision: Union[str, Sequence[str], None] = "a4c82f1e9d35"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    op.drop_index("ix_scraped_items_id", table_name="scraped_items")
+    op.drop_constraint("scraped_items_url_key", "scraped_items", type_="unique")
+    # Build without blocking writes on large tables.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_scraped_items_owner_created_at",
+            "scraped_items",
+            ["owner_id", "created_at", "id"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    op.drop_index("ix_scraped_items_owner_created_at", table_name="scraped_items")
+    op.create_unique_constraint("scraped_items_url_key", "scraped_items", ["url"])
+    op.create_index("ix_scraped_items_id", "scraped_items", ["id"])
@@ -0,0 +1,27 @@
+"""add cover_sha256 to scraped_items
+
+Revision ID: e2b7d5a90c13
+Revises: c6e1f08b7a52
+Create Date: 2026-10-19 17:28:44.106291
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from typing import Sequence, Union
+
+
+revision: str = "e2b7d5a90c13"
+down_revision: Union[str, Sequence[str], None] = "c6e1f08b7a52"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    op.add_column(
+        "scraped_items", sa.Column("cover_sha256", sa.String(length=64), nullable=True)
+    )
+
+
+def downgrade():
+    op.drop_column("scraped_items", "cover_sha256")
@@ -0,0 +1,176 @@
+"""
+Typed application settings for the Web Scraper API.
+
+Settings are read from environment variables (and a ``.env`` file, if present)
+the first time get_settings() is called, then cached for the life of the
+process. Nothing is read at import time, so importing the app stays cheap.
+
+Scraper tuning variables (SCRAPER_*, HTTP_POOL_*) are read by the scraper
+modules themselves, which are only imported on first scrape.
+"""
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    Application settings.
+
+    Attributes:
+        postgres_user (str | None): Database user.
+        postgres_password (str | None): Database password.
+        postgres_host (str | None): Database host.
+        postgres_port (str): Database port.
+        postgres_db (str | None): Database name.
+        read_database_url (str | None): Optional DSN of a read replica.
+        db_pool_size (int): Connection pool size of the primary engine.
+        db_max_overflow (int): Extra connections allowed above the primary pool.
+        db_read_pool_size (int): Connection pool size of the read engine.
+        db_read_max_overflow (int): Extra connections allowed above the read pool.
+        db_rate_limit_pool_size (int): Connection pool size of the rate limiter
+            engine (postgres backend).
+        db_rate_limit_max_overflow (int): Extra connections allowed above the
+            rate limiter pool.
+        read_your_writes_seconds (float): How long a user's reads stay on the
+            primary after they changed their items.
+        log_level (str): Root log level.
+        sqlalchemy_echo (bool): Log SQL statements.
+        secret_key (str | None): Key used to sign access tokens.
+        refresh_secret_key (str | None): Key used to sign refresh tokens.
+        jwt_algorithm (str): JWT signing algorithm.
+        access_token_expire_minutes (int): Access token lifetime.
+        refresh_token_expire_days (int): Refresh token lifetime.
+        items_cache_size (int): Max cached GET /items pages; 0 disables.
+        items_cache_bytes (int): Max total bytes of cached pages per process;
+            0 disables.
+        ingest_batch_size (int): Rows per insert batch when streaming ingest.
+        scrape_stream_batch_size (int): Items per insert batch in GET /scrape/stream.
+        scrape_progress_seconds (float): Minimum interval between progress events.
+        rate_limit_enabled (bool): Enforce per-user API rate limits.
+        rate_limit_backend (str): Bucket storage, ``memory`` or ``postgres``.
+        scrape_rate_burst (int): Scrapes a user may start back to back.
+        scrape_rate_per_hour (float): Sustained scrapes per user per hour.
+        items_rate_burst (int): Item requests a user may send back to back.
+        items_rate_per_minute (float): Sustained item requests per user per minute.
+        slow_query_ms (float): Log SQL statements slower than this.
+        query_count_warn (int): Log requests running at least this many statements.
+        profile_admin_token (str | None): X-Profile header value that forces profiling.
+        profile_sample_rate (float): Fraction of requests profiled at random.
+        profiler (str): ``cprofile`` or ``pyinstrument``.
+        profile_dir (str): Directory receiving saved profiles.
+        profile_ring_size (int): Number of newest profiles kept on disk.
+    """
+
+    postgres_user: Optional[str] = None
+    postgres_password: Optional[str] = None
+    postgres_host: Optional[str] = None
+    postgres_port: str = "5432"
+    postgres_db: Optional[str] = None
+    read_database_url: Optional[str] = None
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_read_pool_size: int = 5
+    db_read_max_overflow: int = 10
+    db_rate_limit_pool_size: int = 5
+    db_rate_limit_max_overflow: int = 10
+    read_your_writes_seconds: float = 5.0
+    log_level: str = "INFO"
+    sqlalchemy_echo: bool = False
+    secret_key: Optional[str] = None
+    refresh_secret_key: Optional[str] = None
+    jwt_algorithm: str = "HS256"
+    access_token_expire_minutes: int = 60
+    refresh_token_expire_days: int = 7
+    items_cache_size: int = 1024
+    items_cache_bytes: int = 64 * 2**20
+    ingest_batch_size: int = 500
+    scrape_stream_batch_size: int = 10
+    scrape_progress_seconds: float = 1.0
+    rate_limit_enabled: bool = True
+    rate_limit_backend: str = "memory"
+    scrape_rate_burst: int = 2
+    scrape_rate_per_hour: float = 10.0
+    items_rate_burst: int = 60
+    items_rate_per_minute: float = 120.0
+    slow_query_ms: float = 200.0
+    query_count_warn: int = 20
+    profile_admin_token: Optional[str] = None
+    profile_sample_rate: float = 0.0
+    profiler: str = "cprofile"
+    profile_dir: str = "/tmp/webscraper-profiles"
+    profile_ring_size: int = 50
+
+    @property
+    def database_url(self) -> str:
+        """SQLAlchemy URL for the primary PostgreSQL database."""
+        return (
+            f"postgresql+psycopg2://{self.postgres_user}:{self.postgres_password}"
+            f"@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
+        )
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """Build settings from the current environment."""
+        secret_key = os.getenv("SECRET_KEY")
+        return cls(
+            postgres_user=os.getenv("POSTGRES_USER"),
+            postgres_password=os.getenv("POSTGRES_PASSWORD"),
+            postgres_host=os.getenv("POSTGRES_HOST"),
+            postgres_port=os.getenv("POSTGRES_PORT", "5432"),
+            postgres_db=os.getenv("POSTGRES_DB"),
+            read_database_url=os.getenv("DATABASE_READ_URL") or None,
+            db_pool_size=int(os.getenv("DB_POOL_SIZE", "5")),
+            db_max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10")),
+            db_read_pool_size=int(os.getenv("DB_READ_POOL_SIZE", "5")),
+            db_read_max_overflow=int(os.getenv("DB_READ_MAX_OVERFLOW", "10")),
+            db_rate_limit_pool_size=int(os.getenv("DB_RATE_LIMIT_POOL_SIZE", "5")),
+            db_rate_limit_max_overflow=int(
+                os.getenv("DB_RATE_LIMIT_MAX_OVERFLOW", "10")
+            ),
+            read_your_writes_seconds=float(os.getenv("READ_YOUR_WRITES_SECONDS", "5")),
+            log_level=os.getenv("LOG_LEVEL", "INFO").upper(),
+            sqlalchemy_echo=os.getenv("SQLALCHEMY_ECHO") == "1",
+            secret_key=secret_key,
+            refresh_secret_key=os.getenv("REFRESH_SECRET_KEY", secret_key),
+            jwt_algorithm=os.getenv("JWT_ALGORITHM", "HS256"),
+            access_token_expire_minutes=int(
+                os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "60")
+            ),
+            refresh_token_expire_days=int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "7")),
+            items_cache_size=int(os.getenv("ITEMS_CACHE_SIZE", "1024")),
+            items_cache_bytes=int(os.getenv("ITEMS_CACHE_BYTES", str(64 * 2**20))),
+            ingest_batch_size=int(os.getenv("INGEST_BATCH_SIZE", "500")),
+            scrape_stream_batch_size=int(os.getenv("SCRAPE_STREAM_BATCH_SIZE", "10")),
+            scrape_progress_seconds=float(os.getenv("SCRAPE_PROGRESS_SECONDS", "1")),
+            rate_limit_enabled=os.getenv("RATE_LIMIT_ENABLED", "1") == "1",
+            rate_limit_backend=os.getenv("RATE_LIMIT_BACKEND", "memory").lower(),
+            scrape_rate_burst=int(os.getenv("SCRAPE_RATE_BURST", "2")),
+            scrape_rate_per_hour=float(os.getenv("SCRAPE_RATE_PER_HOUR", "10")),
+            items_rate_burst=int(os.getenv("ITEMS_RATE_BURST", "60")),
+            items_rate_per_minute=float(os.getenv("ITEMS_RATE_PER_MINUTE", "120")),
+            slow_query_ms=float(os.getenv("SLOW_QUERY_MS", "200")),
+            query_count_warn=int(os.getenv("QUERY_COUNT_WARN", "20")),
+            profile_admin_token=os.getenv("PROFILE_ADMIN_TOKEN") or None,
+            profile_sample_rate=float(os.getenv("PROFILE_SAMPLE_RATE", "0")),
+            profiler=os.getenv("PROFILER", "cprofile").lower(),
+            profile_dir=os.getenv("PROFILE_DIR", "/tmp/webscraper-profiles"),
+            profile_ring_size=int(os.getenv("PROFILE_RING_SIZE", "50")),
+        )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Load ``.env`` and build the settings object once per process.
+
+    Returns:
+        Settings: Cached application settings.
+    """
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    return Settings.from_env()
@@ -1,48 +1,172 @@
 """
 Database configuration and session management for the Web Scraper API.
 
-- Loads database connection details from environment variables.
-- Creates SQLAlchemy engine and session factory.
-- Provides a session generator dependency for FastAPI routes.
+- Builds the SQLAlchemy engines lazily from the typed settings object,
+  normally once in the application lifespan.
+- The primary engine takes all writes. When DATABASE_READ_URL is set, a
+  second engine with its own pool serves read-only traffic; otherwise reads
+  share the primary engine.
+- The postgres rate limit backend gets a third, autocommit engine on the
+  primary database with its own pool, so a limited request never waits for
+  a second connection from the pool its own session is using.
+- Provides session factories and session generator dependencies for
+  read-write (get_db) and read-only (get_read_db) routes.
 
 Uses PostgreSQL with psycopg2 driver.
 """
 
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
-import os
-from dotenv import load_dotenv
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
 
-load_dotenv()
+from app.core.config import Settings, get_settings
 
-DB_USER = os.getenv("POSTGRES_USER")
-DB_PASSWORD = os.getenv("POSTGRES_PASSWORD")
-DB_HOST = os.getenv("POSTGRES_HOST")
-DB_PORT = os.getenv("POSTGRES_PORT", "5432")
-DB_NAME = os.getenv("POSTGRES_DB")
+engine: Optional[Engine] = None
+read_engine: Optional[Engine] = None
+rate_limit_engine: Optional[Engine] = None
+SessionLocal = sessionmaker(autocommit=False, autoflush=False)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False)
 
-DATABASE_URL = (
-    f"postgresql+psycopg2://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
-)
+Base = declarative_base()
 
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
 
-Base = declarative_base()
+def init_engine(settings: Optional[Settings] = None) -> Engine:
+    """
+    Create the engines and bind the session factories if not done yet.
+
+    Args:
+        settings (Settings | None): Settings to use; defaults to get_settings().
+
+    Returns:
+        Engine: The process-wide primary SQLAlchemy engine.
+    """
+    global engine, read_engine
+    if engine is None:
+        settings = settings or get_settings()
+        engine = create_engine(
+            settings.database_url,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+        )
+        if settings.read_database_url:
+            read_engine = create_engine(
+                settings.read_database_url,
+                pool_size=settings.db_read_pool_size,
+                max_overflow=settings.db_read_max_overflow,
+                execution_options={"postgresql_readonly": True},
+            )
+        else:
+            read_engine = engine
+        SessionLocal.configure(bind=engine)
+        ReadSessionLocal.configure(bind=read_engine)
+    return engine
+
+
+def get_engine() -> Engine:
+    """Return the process-wide primary engine, creating it on first use."""
+    return engine if engine is not None else init_engine()
+
+
+def get_read_engine() -> Engine:
+    """Return the engine serving reads (the primary if no replica is set)."""
+    if engine is None:
+        init_engine()
+    return read_engine
+
+
+def get_rate_limit_engine() -> Engine:
+    """Return the autocommit engine of the rate limiter, creating it on first use."""
+    global rate_limit_engine
+    if rate_limit_engine is None:
+        settings = get_settings()
+        rate_limit_engine = create_engine(
+            settings.database_url,
+            pool_size=settings.db_rate_limit_pool_size,
+            max_overflow=settings.db_rate_limit_max_overflow,
+            isolation_level="AUTOCOMMIT",
+        )
+    return rate_limit_engine
+
+
+def dispose_engine() -> None:
+    """Close all pooled connections and discard the engines."""
+    global engine, read_engine, rate_limit_engine
+    if rate_limit_engine is not None:
+        rate_limit_engine.dispose()
+        rate_limit_engine = None
+    if read_engine is not None and read_engine is not engine:
+        read_engine.dispose()
+    if engine is not None:
+        engine.dispose()
+    engine = read_engine = None
 
 
 def get_db():
     """
-    Provide a database session for a request and ensure it is closed after use.
+    Provide a read-write database session for a request and ensure it is closed after use.
 
-    This function is a generator yielding a SQLAlchemy SessionLocal instance.
-    It is designed to be used as a FastAPI dependency to handle DB sessions.
+    This function is a generator yielding a SQLAlchemy SessionLocal instance
+    bound to the primary. It is designed to be used as a FastAPI dependency
+    to handle DB sessions.
 
     Yields:
         Session: SQLAlchemy database session instance.
     """
+    if engine is None:
+        init_engine()
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+def get_read_db():
+    """
+    Provide a read-only database session bound to the read engine.
+
+    Yields:
+        Session: SQLAlchemy database session instance.
+    """
+    if engine is None:
+        init_engine()
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def read_session_after_write(
+    last_write_at: Optional[datetime], primary: Optional[Session] = None
+):
+    """
+    Provide a read session that honors read-your-writes.
+
+    Reads go to the replica unless the caller wrote within the last
+    READ_YOUR_WRITES_SECONDS, in which case the primary serves them so the
+    change is visible despite replication lag.
+
+    Args:
+        last_write_at (datetime | None): Time of the caller's latest write.
+        primary (Session | None): The request's primary session, reused when
+            the primary serves the read so no second connection is taken.
+
+    Yields:
+        Session: SQLAlchemy database session instance.
+    """
+    window = timedelta(seconds=get_settings().read_your_writes_seconds)
+    recent = (
+        last_write_at is not None
+        and datetime.now(timezone.utc) - last_write_at < window
+    )
+    if recent or get_read_engine() is engine:
+        if primary is not None:
+            yield primary
+        else:
+            yield from get_db()
+    else:
+        yield from get_read_db()
@@ -0,0 +1,191 @@
+"""
+Process-wide HTTP client for outbound scraper traffic.
+
+- Holds a single requests.Session whose connection pools are reused
+  across scrapes, so keep-alive connections skip repeated TCP/TLS handshakes.
+- Pool sizes are configurable via environment variables.
+- Advertises compressed transfer (gzip/deflate, plus br when a brotli
+  decoder is installed).
+- Tracks connection reuse and bytes saved by compression.
+
+The client is created on the first scrape and closed in the application
+lifespan on shutdown; scripts running outside the app get the same lazy client.
+
+requests/urllib3 only speak HTTP/1.1, so multiplexing is not available;
+persistent keep-alive pools provide the connection reuse instead.
+requests itself is imported when the client is first created.
+"""
+
+import logging
+import os
+import threading
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    import requests
+
+USER_AGENT = os.getenv("SCRAPER_USER_AGENT", "WebScraper/1.0")
+POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", "10"))
+POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "20"))
+POOL_BLOCK = os.getenv("HTTP_POOL_BLOCK", "0") == "1"
+
+logger = logging.getLogger(__name__)
+
+
+def _accept_encoding() -> str:
+    """Return the Accept-Encoding value supported by the installed decoders."""
+    encodings = ["gzip", "deflate"]
+    try:
+        import brotli  # noqa: F401
+
+        encodings.append("br")
+    except ImportError:
+        try:
+            import brotlicffi  # noqa: F401
+
+            encodings.append("br")
+        except ImportError:
+            pass
+    return ", ".join(encodings)
+
+
+class HttpClient:
+    """
+    Shared HTTP session with tuned connection pools and transfer metrics.
+
+    Args:
+        pool_connections (int): Number of per-host pools to cache.
+        pool_maxsize (int): Maximum connections kept alive per host.
+        pool_block (bool): Block when the pool is exhausted instead of
+            opening throwaway connections.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = POOL_CONNECTIONS,
+        pool_maxsize: int = POOL_MAXSIZE,
+        pool_block: bool = POOL_BLOCK,
+    ):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update(
+            {
+                "User-Agent": USER_AGENT,
+                "Accept-Encoding": _accept_encoding(),
+                "Connection": "keep-alive",
+            }
+        )
+        self._lock = threading.Lock()
+        self.responses = 0
+        self.wire_bytes = 0
+        self.decoded_bytes = 0
+
+    def get(self, url: str, **kwargs) -> "requests.Response":
+        """Issue a GET request through the shared session."""
+        return self.session.get(url, **kwargs)
+
+    def record(self, wire_bytes: int, decoded_bytes: int) -> None:
+        """
+        Record transfer sizes for a fully read response body.
+
+        Args:
+            wire_bytes (int): Bytes received on the wire (possibly compressed).
+            decoded_bytes (int): Bytes after content decoding.
+        """
+        with self._lock:
+            self.responses += 1
+            self.wire_bytes += wire_bytes
+            self.decoded_bytes += decoded_bytes
+
+    def _pool_stats(self) -> tuple[int, int]:
+        """Return (connections opened, requests sent) across all pools."""
+        connections = 0
+        requests_sent = 0
+        seen = set()
+        for adapter in self.session.adapters.values():
+            if id(adapter) in seen:
+                continue
+            seen.add(id(adapter))
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                connections += getattr(pool, "num_connections", 0)
+                requests_sent += getattr(pool, "num_requests", 0)
+        return connections, requests_sent
+
+    def metrics(self) -> dict:
+        """
+        Return connection-reuse and compression metrics.
+
+        Returns:
+            dict: Connections opened, requests sent, reused connections,
+                reuse ratio, wire/decoded bytes and bytes saved.
+        """
+        connections, requests_sent = self._pool_stats()
+        reused = max(0, requests_sent - connections)
+        with self._lock:
+            wire, decoded, responses = self.wire_bytes, self.decoded_bytes, self.responses
+        return {
+            "connections_opened": connections,
+            "requests_sent": requests_sent,
+            "connections_reused": reused,
+            "reuse_ratio": round(reused / requests_sent, 3) if requests_sent else 0.0,
+            "responses": responses,
+            "wire_bytes": wire,
+            "decoded_bytes": decoded,
+            "bytes_saved": max(0, decoded - wire),
+            "accept_encoding": self.session.headers["Accept-Encoding"],
+        }
+
+    def close(self) -> None:
+        """Close the session and all pooled connections."""
+        self.session.close()
+
+
+_client: Optional[HttpClient] = None
+_client_lock = threading.Lock()
+
+
+def init_http_client() -> HttpClient:
+    """
+    Create the process-wide HTTP client if it does not exist yet.
+
+    Returns:
+        HttpClient: The shared client.
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient()
+            logger.info(
+                "HTTP client ready (pool_connections=%s, pool_maxsize=%s)",
+                POOL_CONNECTIONS,
+                POOL_MAXSIZE,
+            )
+        return _client
+
+
+def get_http_client() -> HttpClient:
+    """Return the shared HTTP client, creating it on first use."""
+    return _client if _client is not None else init_http_client()
+
+
+def close_http_client() -> None:
+    """Close and discard the shared HTTP client."""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+            logger.info("HTTP client closed")
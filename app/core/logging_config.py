@@ -2,26 +2,29 @@
 Logging configuration for the Web Scraper API.
 
 Sets up the root logger with a stream handler outputting to stdout,
-configures the logging level based on environment variables,
+configures the logging level based on the application settings,
 and adjusts logging verbosity for external libraries.
 """
 
 import logging
-import os
 import sys
+from typing import Optional
 
+from app.core.config import Settings, get_settings
 
-def configure_logging() -> None:
+
+def configure_logging(settings: Optional[Settings] = None) -> None:
     """
     Configure application-wide logging settings.
 
-    - Sets log level from the LOG_LEVEL environment variable (default INFO).
+    - Sets log level from the LOG_LEVEL setting (default INFO).
     - Clears any existing handlers and attaches a StreamHandler to stdout.
     - Applies a consistent log message format with timestamps and logger names.
     - Sets urllib3 logging to WARNING level to reduce noise.
-    - Adjusts SQLAlchemy engine logging verbosity based on SQLALCHEMY_ECHO environment variable.
+    - Adjusts SQLAlchemy engine logging verbosity based on SQLALCHEMY_ECHO setting.
     """
-    level = os.getenv("LOG_LEVEL", "INFO").upper()
+    settings = settings or get_settings()
+    level = settings.log_level
 
     root = logging.getLogger()
     root.handlers.clear()
@@ -35,5 +38,5 @@ def configure_logging() -> None:
 
     logging.getLogger("urllib3").setLevel(logging.WARNING)
     logging.getLogger("sqlalchemy.engine.Engine").setLevel(
-        logging.INFO if os.getenv("SQLALCHEMY_ECHO") == "1" else logging.WARNING
+        logging.INFO if settings.sqlalchemy_echo else logging.WARNING
     )
@@ -0,0 +1,268 @@
+"""
+Opt-in request profiling and SQL query tracing.
+
+- Each request gets a RequestTrace (held in a context variable, so it is
+  visible from the threadpool running sync endpoints) that counts SQL
+  statements and their total time; requests that run more than
+  QUERY_COUNT_WARN statements are logged as N+1 suspects.
+- SQLAlchemy cursor hooks log statements slower than SLOW_QUERY_MS with
+  the shape of their parameters (never the values) and the calling route.
+- A request is profiled when it sends ``X-Profile: <PROFILE_ADMIN_TOKEN>``
+  or is picked by PROFILE_SAMPLE_RATE. The endpoint runs under cProfile
+  (or pyinstrument with PROFILER=pyinstrument) via ProfiledRoute, and the
+  result is written to PROFILE_DIR, keeping the newest PROFILE_RING_SIZE files.
+
+Classes:
+- RequestTrace: Per-request query counters and profiler output.
+- ProfiledRoute: APIRoute that runs endpoints under the profiler on demand.
+
+Functions:
+- install_query_hooks: Attach the cursor hooks to an engine.
+- start_trace / finish_trace / save_profile: Used by the profiling middleware.
+"""
+
+import contextvars
+import cProfile
+import functools
+import inspect
+import itertools
+import logging
+import os
+import random
+import re
+import time
+from typing import Any, Optional
+
+from fastapi.routing import APIRoute
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+_trace: contextvars.ContextVar[Optional["RequestTrace"]] = contextvars.ContextVar(
+    "request_trace", default=None
+)
+_sequence = itertools.count()
+
+
+class RequestTrace:
+    """
+    Per-request query counters and profiler state.
+
+    Attributes:
+        route (str): ``METHOD /path`` of the request.
+        profile (bool): Whether the endpoint should run under the profiler.
+        query_count (int): SQL statements executed.
+        query_ms (float): Total time spent in SQL statements.
+        profiler (Any): cProfile.Profile or pyinstrument Profiler of the request;
+            finished once the endpoint returns.
+    """
+
+    __slots__ = ("route", "profile", "query_count", "query_ms", "profiler")
+
+    def __init__(self, route: str, profile: bool):
+        self.route = route
+        self.profile = profile
+        self.query_count = 0
+        self.query_ms = 0.0
+        self.profiler: Any = None
+
+
+def _param_shape(params: Any) -> str:
+    """Describe statement parameters without revealing their values."""
+    if isinstance(params, dict):
+        return f"dict[{len(params)} keys]"
+    if isinstance(params, (list, tuple)):
+        if params and isinstance(params[0], (dict, list, tuple)):
+            return f"{len(params)} x {_param_shape(params[0])}"
+        return f"{type(params).__name__}[{len(params)}]"
+    return type(params).__name__
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_start"].pop()
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    trace = _trace.get()
+    if trace is not None:
+        trace.query_count += 1
+        trace.query_ms += elapsed_ms
+    if elapsed_ms >= get_settings().slow_query_ms:
+        logger.warning(
+            "Slow query (%.1f ms) on %s: %s | params=%s%s",
+            elapsed_ms,
+            trace.route if trace else "<no request>",
+            " ".join(statement.split())[:500],
+            _param_shape(parameters),
+            " (executemany)" if executemany else "",
+        )
+
+
+def install_query_hooks(engine: Engine) -> None:
+    """
+    Attach the query counting and slow-query hooks to an engine.
+
+    Args:
+        engine (Engine): Engine to instrument; repeated calls are no-ops.
+    """
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def start_trace(method: str, path: str, profile_header: Optional[str]):
+    """
+    Create the trace for a request and make it current.
+
+    Args:
+        method (str): HTTP method.
+        path (str): Request path.
+        profile_header (str | None): Value of the X-Profile header.
+
+    Returns:
+        tuple[RequestTrace, contextvars.Token]: The trace and the token to reset it.
+    """
+    settings = get_settings()
+    requested = bool(settings.profile_admin_token) and (
+        profile_header == settings.profile_admin_token
+    )
+    sampled = settings.profile_sample_rate > 0 and (
+        random.random() < settings.profile_sample_rate
+    )
+    trace = RequestTrace(f"{method} {path}", requested or sampled)
+    return trace, _trace.set(trace)
+
+
+def finish_trace(trace: RequestTrace, token: contextvars.Token) -> None:
+    """
+    Reset the current trace and log the request if it looks like N+1.
+
+    Args:
+        trace (RequestTrace): Trace returned by start_trace.
+        token (contextvars.Token): Token returned by start_trace.
+    """
+    _trace.reset(token)
+    if trace.query_count >= get_settings().query_count_warn:
+        logger.warning(
+            "Possible N+1: %s ran %s queries (%.1f ms)",
+            trace.route,
+            trace.query_count,
+            trace.query_ms,
+        )
+
+
+def save_profile(trace: RequestTrace) -> str:
+    """
+    Write a captured profile into the ring directory and evict the oldest files.
+
+    Blocking (disk I/O); call it from a worker thread.
+
+    Args:
+        trace (RequestTrace): Trace whose ``profiler`` holds a finished profile.
+
+    Returns:
+        str: File name of the saved profile.
+    """
+    settings = get_settings()
+    os.makedirs(settings.profile_dir, exist_ok=True)
+    slug = re.sub(r"[^A-Za-z0-9]+", "-", trace.route).strip("-")[:80]
+    stem = f"{int(time.time())}-{next(_sequence):06d}-{slug}"
+
+    if isinstance(trace.profiler, cProfile.Profile):
+        name = f"{stem}.prof"
+        trace.profiler.dump_stats(os.path.join(settings.profile_dir, name))
+    else:
+        name = f"{stem}.html"
+        with open(os.path.join(settings.profile_dir, name), "w", encoding="utf-8") as f:
+            f.write(trace.profiler.output_html())
+
+    entries = sorted(
+        (e for e in os.scandir(settings.profile_dir) if e.is_file()),
+        key=lambda e: e.stat().st_mtime,
+    )
+    for entry in entries[: max(0, len(entries) - settings.profile_ring_size)]:
+        try:
+            os.unlink(entry.path)
+        except FileNotFoundError:
+            pass
+    logger.info("Profile for %s saved as %s", trace.route, name)
+    return name
+
+
+def _start_profiler():
+    """Start and return a cProfile or pyinstrument profiler per PROFILER."""
+    if get_settings().profiler == "pyinstrument":
+        try:
+            from pyinstrument import Profiler
+
+            profiler = Profiler(async_mode="disabled")
+            profiler.start()
+            return profiler
+        except ImportError:
+            logger.warning("pyinstrument not installed; falling back to cProfile")
+    profiler = cProfile.Profile()
+    profiler.enable()
+    return profiler
+
+
+def _stop_profiler(profiler) -> None:
+    if isinstance(profiler, cProfile.Profile):
+        profiler.disable()
+    else:
+        profiler.stop()
+
+
+def _profiled(endpoint):
+    """
+    Wrap an endpoint so it runs under the profiler when the trace asks for it.
+
+    FastAPI rebuilds a router's routes with the same route class when the
+    router is included in the app, so an endpoint that is already wrapped
+    is returned unchanged. The first profiler started for a request is the
+    one kept on the trace; a nested wrapper never replaces it.
+    """
+    if getattr(endpoint, "__profiled__", False):
+        return endpoint
+
+    if inspect.iscoroutinefunction(endpoint):
+
+        @functools.wraps(endpoint)
+        async def async_wrapper(*args, **kwargs):
+            trace = _trace.get()
+            if trace is None or not trace.profile or trace.profiler is not None:
+                return await endpoint(*args, **kwargs)
+            profiler = trace.profiler = _start_profiler()
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                _stop_profiler(profiler)
+
+        async_wrapper.__profiled__ = True
+        return async_wrapper
+
+    @functools.wraps(endpoint)
+    def wrapper(*args, **kwargs):
+        # Sync endpoints run in a worker thread; profile that thread.
+        trace = _trace.get()
+        if trace is None or not trace.profile or trace.profiler is not None:
+            return endpoint(*args, **kwargs)
+        profiler = trace.profiler = _start_profiler()
+        try:
+            return endpoint(*args, **kwargs)
+        finally:
+            _stop_profiler(profiler)
+
+    wrapper.__profiled__ = True
+    return wrapper
+
+
+class ProfiledRoute(APIRoute):
+    """APIRoute whose endpoint runs under the profiler for sampled requests."""
+
+    def __init__(self, path: str, endpoint, **kwargs):
+        super().__init__(path, _profiled(endpoint), **kwargs)
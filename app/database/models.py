@@ -4,12 +4,21 @@ SQLAlchemy ORM models defining database schema for the Web Scraper API.
 Includes models for:
 - ScrapedItem: Represents individual scraped data entries tied to a user.
 - User: Represents registered users with authentication credentials.
+- RateLimitBucket: Token bucket state for per-user API rate limiting.
+- UserItemStats: Incrementally maintained per-user collection statistics.
 
 Uses PostgreSQL UUID columns for primary keys and timestamps for creation time.
 """
 
 from sqlalchemy import (
+    BigInteger,
+    Boolean,
     Column,
+    Float,
+    Index,
+    Integer,
+    Numeric,
+    SmallInteger,
     String,
     Text,
     DateTime,
@@ -32,24 +41,42 @@ class ScrapedItem(Base):
         id (UUID): Primary key, unique identifier for the scraped item.
         title (str): Title of the scraped item.
         description (str): Optional detailed description.
-        url (str): Unique URL of the scraped item.
+        url (str): URL of the scraped item, unique per owner.
         created_at (datetime): Timestamp of when the item was created.
+        price (Decimal): Price shown on the product page.
+        stock (int): Number of copies available.
+        rating (int): Star rating from 1 to 5.
+        upc (str): Universal Product Code.
+        category (str): Product category.
+        cover_sha256 (str): Hash of the cover image in the asset store.
         owner_id (UUID): Foreign key linking to the User who owns this item.
         owner (User): SQLAlchemy relationship to the owning User.
     """
 
     __tablename__ = "scraped_items"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     title = Column(String, nullable=False)
     description = Column(Text)
-    url = Column(String, nullable=False, unique=True)
+    url = Column(String, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    price = Column(Numeric(10, 2))
+    stock = Column(Integer)
+    rating = Column(SmallInteger)
+    upc = Column(String(32))
+    category = Column(String)
+    cover_sha256 = Column(String(64))
 
     owner_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     owner = relationship("User", backref="items")
 
-    __table_args__ = (UniqueConstraint("owner_id", "url", name="uq_owner_url"),)
+    __table_args__ = (
+        UniqueConstraint("owner_id", "url", name="uq_owner_url"),
+        Index("ix_scraped_items_owner_created_at", "owner_id", "created_at", "id"),
+        Index("ix_scraped_items_owner_price", "owner_id", "price"),
+        Index("ix_scraped_items_owner_rating", "owner_id", "rating"),
+        Index("ix_scraped_items_owner_category_price", "owner_id", "category", "price"),
+    )
 
 
 class User(Base):
@@ -61,6 +88,10 @@ class User(Base):
         username (str): Unique username for login.
         hashed_password (str): Hashed password for authentication.
         created_at (datetime): Timestamp when the user was created.
+        items_version (int): Counter bumped whenever the user's items change,
+            used to build ETags for item responses.
+        items_updated_at (datetime): Time of the latest change to the user's
+            items, used to route their reads to the primary right after a write.
     """
 
     __tablename__ = "users"
@@ -69,3 +100,51 @@ class User(Base):
     username = Column(String, unique=True, index=True)
     hashed_password = Column(String, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    items_version = Column(Integer, nullable=False, default=0, server_default="0")
+    items_updated_at = Column(DateTime(timezone=True))
+
+
+class RateLimitBucket(Base):
+    """
+    Token bucket state shared by all workers when RATE_LIMIT_BACKEND=postgres.
+
+    The table is UNLOGGED: buckets are cheap to lose on a crash (they simply
+    refill), and skipping the WAL keeps the per-request upsert fast.
+
+    Attributes:
+        key (str): Bucket identifier, ``<scope>:<user id>``.
+        tokens (float): Tokens left at ``updated_at``.
+        allowed (bool): Whether the latest request was allowed.
+        updated_at (datetime): Time of the latest request.
+    """
+
+    __tablename__ = "rate_limit_buckets"
+    __table_args__ = {"prefixes": ["UNLOGGED"]}
+
+    key = Column(String, primary_key=True)
+    tokens = Column(Float, nullable=False)
+    allowed = Column(Boolean, nullable=False, default=True)
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+
+class UserItemStats(Base):
+    """
+    Summary of a user's item collection, kept in step with every item write.
+
+    Attributes:
+        user_id (UUID): Primary key, the user summarized.
+        item_count (int): Number of items the user owns.
+        description_bytes (int): Total size of the items' descriptions in bytes.
+        last_scraped_at (datetime): Start time of the user's latest scrape.
+        last_scrape_inserted (int): New items stored by that scrape.
+    """
+
+    __tablename__ = "user_item_stats"
+
+    user_id = Column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    item_count = Column(Integer, nullable=False, default=0, server_default="0")
+    description_bytes = Column(BigInteger, nullable=False, default=0, server_default="0")
+    last_scraped_at = Column(DateTime(timezone=True))
+    last_scrape_inserted = Column(Integer)
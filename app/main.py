@@ -3,7 +3,9 @@ Main entry point for the Web Scraper API FastAPI application.
 
 Sets up the FastAPI app, configures logging, includes API routers, and adds middleware for request logging and exception handling.
 
-Includes lifecycle event handling with async context manager.
+Includes lifecycle event handling with async context manager: settings,
+logging and the database engine are built once at startup rather than at
+import time, so importing the app (worker spawn, tests, Alembic) stays cheap.
 
 Routes included:
 - /auth (Authentication-related endpoints)
@@ -15,20 +17,37 @@ import time
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from starlette import status
+from starlette.concurrency import run_in_threadpool
 from contextlib import asynccontextmanager
 
+from app.core.config import get_settings
+from app.core.database import init_engine, get_read_engine, dispose_engine
 from app.core.logging_config import configure_logging
+from app.core.profiling import (
+    install_query_hooks,
+    start_trace,
+    finish_trace,
+    save_profile,
+)
 from app.routes import auth_router, api_router
 
 
-configure_logging()
 logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifespan events."""
+    settings = get_settings()
+    configure_logging(settings)
+    install_query_hooks(init_engine(settings))
+    install_query_hooks(get_read_engine())
+    logger.info("Application startup complete")
     yield
+    from app.core.http_client import close_http_client
+
+    close_http_client()
+    dispose_engine()
     logger.info("Application shutdown complete")
 
 
@@ -54,6 +73,33 @@ async def log_requests(request: Request, call_next):
     return response
 
 
+@app.middleware("http")
+async def rate_limit_headers(request: Request, call_next):
+    """Attach X-RateLimit-* headers recorded by the rate limit dependencies."""
+    response = await call_next(request)
+    result = getattr(request.state, "rate_limit", None)
+    if result is not None:
+        for name, value in result.headers().items():
+            response.headers.setdefault(name, value)
+    return response
+
+
+@app.middleware("http")
+async def profile_requests(request: Request, call_next):
+    """Count SQL statements per request and save opt-in profiles."""
+    trace, token = start_trace(
+        request.method, request.url.path, request.headers.get("X-Profile")
+    )
+    try:
+        response = await call_next(request)
+    finally:
+        finish_trace(trace, token)
+    response.headers["X-Query-Count"] = str(trace.query_count)
+    if trace.profiler is not None:
+        response.headers["X-Profile-Id"] = await run_in_threadpool(save_profile, trace)
+    return response
+
+
 @app.exception_handler(Exception)
 async def unhandled_exception_handler(request: Request, exc: Exception):
     """Handle unexpected exceptions with a 500 Internal Server Error response."""
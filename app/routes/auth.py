@@ -8,21 +8,20 @@ handling password hashing, user verification, and JWT token creation.
 from fastapi import APIRouter, Depends, Cookie, HTTPException, status, Response
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
+from app.core.config import get_settings
 from app.core.database import get_db
+from app.core.profiling import ProfiledRoute
 from app.database.models import User
 from app.schemas import UserCreate, Token, UserRead
 from app.services.auth_service import (
     get_password_hash,
     verify_password,
     create_access_token,
+    create_refresh_token,
+    verify_refresh_token,
 )
-from jose import JWTError, jwt
-from app.schemas import TokenData
-from passlib.context import CryptContext
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-router = APIRouter()
+router = APIRouter(route_class=ProfiledRoute)
 
 @router.post("/register", response_model=UserRead)
 def register(user: UserCreate, db: Session = Depends(get_db)):
@@ -88,6 +87,8 @@ def refresh_access_token(
     response: Response,
     refresh_token: str | None = Cookie(default=None, alias="refresh_token")
 ):
+    from jose import ExpiredSignatureError, JWTError
+
     if not refresh_token:
         raise HTTPException(status_code=401, detail="Missing refresh token")
 
@@ -108,7 +109,7 @@ def refresh_access_token(
         httponly=True,
         secure=False,
         samesite="lax",
-        max_age=REFRESH_TOKEN_EXPIRE_DAYS * 24 * 3600,
+        max_age=get_settings().refresh_token_expire_days * 24 * 3600,
         path="/",
     )
 
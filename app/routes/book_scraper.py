@@ -3,32 +3,131 @@ Book scraper API routes for the Web Scraper application.
 
 Endpoints:
 - POST /scrape: Trigger the book scraping process for authenticated users.
+- GET /scrape/stream: Scrape while streaming items and progress as Server-Sent Events.
+- POST /scrape/reparse: Refresh the user's items from the raw page archive.
 - GET /items: List all scraped items owned by the authenticated user.
+- GET /items/stats: Item count, description bytes and latest scrape of the user.
 - GET /items/{item_id}: Get details of a specific scraped item by ID.
+- GET /items/{item_id}/cover: Serve the item's cover image (or thumbnail).
 - DELETE /items/{item_id}: Delete a specific scraped item by ID.
+- POST /items/batch-get: Fetch many items by ID in one query.
+- DELETE /items: Delete items by ID list and/or filter in one statement.
 
-Includes authorization checks to ensure users can only access their own data.
+Includes authorization checks to ensure users can only access their own data,
+and per-user token-bucket rate limits (429 with Retry-After when exhausted).
+Item reads use the read replica when one is configured (see get_items_read_db),
+carry weak ETags derived from the user's collection version, and answer
+``If-None-Match`` with 304 Not Modified.
+
+The scraper stack (requests, BeautifulSoup and the scraper modules, which
+read their SCRAPER_* settings at import) is imported inside the scrape
+handlers so it is only loaded on first use.
 """
 
+import json
 import logging
-from fastapi import APIRouter, Depends, HTTPException, status
+import os
+import time
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Literal
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.responses import FileResponse, StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy import delete
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from uuid import UUID
-import requests
 
-from app.core.database import get_db
-from app.database.models import ScrapedItem, User
-from app.schemas import ItemRead
-from app.services.scraper_service import scrape_books
-from app.services.ingest import ingest_items
+from app.core.config import get_settings
+from app.core.database import SessionLocal, get_db, get_engine, read_session_after_write
+from app.core.profiling import ProfiledRoute
+from app.database.models import ScrapedItem, User, UserItemStats
+from app.schemas import ItemRead, ItemBatchGet, ItemBatchRead, ItemBulkDelete, ItemStats
+from app.services.ingest import ingest_items, ingest_stream
 from app.services.auth_service import get_current_user
+from app.services.api_rate_limit import items_rate_limit, scrape_rate_limit
+from app.services.item_cache import (
+    bump_items_version,
+    collection_etag,
+    etag_matches,
+    item_etag,
+    items_cache,
+)
+from app.services.item_stats import delete_items
 
-router = APIRouter()
+router = APIRouter(route_class=ProfiledRoute)
 logger = logging.getLogger(__name__)
 
+_items_adapter = TypeAdapter(list[ItemRead])
+_item_adapter = TypeAdapter(ItemRead)
+_CACHE_HEADERS = {"Cache-Control": "private, no-cache"}
+
+ItemSort = Literal[
+    "created_at", "-created_at", "price", "-price", "rating", "-rating", "stock", "-stock"
+]
+_SORT_COLUMNS = {
+    "created_at": ScrapedItem.created_at,
+    "price": ScrapedItem.price,
+    "rating": ScrapedItem.rating,
+    "stock": ScrapedItem.stock,
+}
+
+
+def get_items_read_db(
+    current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
+):
+    """
+    Provide a read session for item reads.
+
+    Served by the read replica, falling back to the primary right after the
+    user's own scrape or delete so they always see their writes. On the
+    primary it is the request's own session (the one that loaded the user),
+    so a read holds one primary connection, not two.
+
+    Yields:
+        Session: SQLAlchemy database session instance.
+    """
+    yield from read_session_after_write(current_user.items_updated_at, primary=db)
+
+
+def _replica_caught_up(db: Session, user: User) -> bool:
+    """
+    Tell whether a read session reflects the user's current collection version.
+
+    Primary sessions always do. A replica session does once it has replayed
+    the write that set ``user.items_version``; until then rows read there
+    must not be cached or served under that version's ETag.
+    """
+    if db.get_bind() is get_engine():
+        return True
+    version = db.query(User.items_version).filter(User.id == user.id).scalar()
+    return version == user.items_version
+
+
+def _not_modified(etag: str) -> Response:
+    """Build an empty 304 response carrying the current ETag."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, **_CACHE_HEADERS},
+    )
+
 
-@router.post("/scrape", response_model=dict)
+def _sse(event: str, data: dict) -> str:
+    """Format one Server-Sent Event."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+def _json(body: bytes, etag: str) -> Response:
+    """Build a JSON response from pre-serialized bytes with an ETag."""
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag, **_CACHE_HEADERS},
+    )
+
+
+@router.post("/scrape", response_model=dict, dependencies=[Depends(scrape_rate_limit)])
 def run_scraper(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -45,54 +144,317 @@ def run_scraper(
         current_user (User): Currently authenticated user.
 
     Returns:
-        dict: Result summary of the ingestion process.
+        dict: Result summary of the ingestion process, including
+            request/retry/rate stats for the scrape under ``scrape`` and
+            shared HTTP client metrics under ``http``.
 
     Raises:
         HTTPException: 502 Bad Gateway if the scraping upstream site is unavailable or request fails.
     """
+    import requests
+    from app.core.http_client import get_http_client
+    from app.services.rate_limiter import ScrapeStats
+    from app.services.scraper_service import scrape_books
+
     logger.info("Items requested by user: %s", current_user.username)
+    scraped_at = datetime.now(timezone.utc)
+    stats = ScrapeStats()
     try:
-        items = scrape_books()
+        items = scrape_books(stats=stats)
     except requests.RequestException:
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
             detail="Upstream site unavailable or request failed",
         )
 
-    result = ingest_items(items, db, owner_id=current_user.id)
+    result = ingest_items(items, db, owner_id=current_user.id, scraped_at=scraped_at)
+    result["scrape"] = stats.as_dict()
+    result["http"] = get_http_client().metrics()
     return result
 
 
-@router.get("/items", response_model=list[ItemRead])
-def list_items(
+@router.get("/scrape/stream", dependencies=[Depends(scrape_rate_limit)])
+def stream_scraper(current_user: User = Depends(get_current_user)):
+    """
+    Scrape books while streaming results as Server-Sent Events.
+
+    Items are ingested in batches of SCRAPE_STREAM_BATCH_SIZE as they are
+    parsed, so the first item reaches the client after a single page fetch
+    instead of after the whole crawl. Events:
+
+    - ``item``: a parsed book (title, url, price, stock, rating, upc, category);
+    - ``progress``: pages done/total, rate, ETA and rows inserted so far,
+      at most every SCRAPE_PROGRESS_SECONDS;
+    - ``done``: final ingest counts with scrape and HTTP client stats;
+    - ``error``: the upstream site failed; rows from earlier batches are kept.
+
+    The scrape stops if the client disconnects; items not yet ingested are
+    dropped.
+
+    Args:
+        current_user (User): Currently authenticated user.
+
+    Returns:
+        StreamingResponse: ``text/event-stream`` of scrape events.
+    """
+    import requests
+    from app.core.http_client import get_http_client
+    from app.services.assets import get_asset_store
+    from app.services.rate_limiter import AdaptiveRateLimiter, ScrapeStats
+    from app.services.scraper_service import ScrapeProgress, fetch_covers, iter_books
+
+    owner_id, username = current_user.id, current_user.username
+    settings = get_settings()
+    logger.info("Streaming scrape requested by user: %s", username)
+
+    def events():
+        stats = ScrapeStats()
+        progress = ScrapeProgress()
+        limiter = AdaptiveRateLimiter(stats=stats)
+        store = get_asset_store()
+        scraped_at = datetime.now(timezone.utc)
+        inserted = batches = 0
+        batch = []
+        last_progress = 0.0
+
+        get_engine()
+        with SessionLocal() as db:
+
+            def flush():
+                nonlocal inserted, batches
+                if batch:
+                    if store is not None:
+                        fetch_covers(batch, get_http_client(), limiter, store)
+                    result = ingest_items(
+                        batch, db, owner_id=owner_id, scraped_at=scraped_at
+                    )
+                    inserted += result["inserted"]
+                    batches += 1
+                    batch.clear()
+
+            try:
+                for item in iter_books(stats=stats, progress=progress, limiter=limiter):
+                    yield _sse(
+                        "item",
+                        {name: getattr(item, name) for name in item.__slots__},
+                    )
+                    batch.append(item)
+                    if len(batch) >= settings.scrape_stream_batch_size:
+                        flush()
+                    now = time.monotonic()
+                    if now - last_progress >= settings.scrape_progress_seconds:
+                        last_progress = now
+                        yield _sse(
+                            "progress", {**progress.as_dict(), "inserted": inserted}
+                        )
+                flush()
+            except requests.RequestException as e:
+                flush()
+                logger.warning("Streaming scrape failed for %s: %s", username, e)
+                yield _sse(
+                    "error",
+                    {
+                        "detail": "Upstream site unavailable or request failed",
+                        "inserted": inserted,
+                    },
+                )
+                return
+
+            yield _sse(
+                "done",
+                {
+                    "inserted": inserted,
+                    "batches": batches,
+                    "progress": progress.as_dict(),
+                    "scrape": stats.as_dict(),
+                    "http": get_http_client().metrics(),
+                },
+            )
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post(
+    "/scrape/reparse", response_model=dict, dependencies=[Depends(scrape_rate_limit)]
+)
+def reparse_scraped_pages(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
+):
+    """
+    Re-run the product selectors over the raw page archive.
+
+    Items are rebuilt from archived pages with no network I/O and applied to
+    the current user's collection in batches. The archive is shared by all
+    users, so only items the user already has are updated with the freshly
+    parsed fields; nothing is inserted and deleted items stay deleted.
+
+    Args:
+        db (Session): SQLAlchemy database session dependency.
+        current_user (User): Currently authenticated user.
+
+    Returns:
+        dict: Number of rows updated and batches committed.
+
+    Raises:
+        HTTPException: 404 Not Found if the page archive is not enabled.
+    """
+    from app.services.archive import get_archive
+    from app.services.scraper_service import reparse_archive
+
+    archive = get_archive()
+    if archive is None:
+        raise HTTPException(status_code=404, detail="Page archive is not enabled")
+
+    logger.info("Archive re-parse requested by user: %s", current_user.username)
+    return ingest_stream(
+        reparse_archive(archive), db, owner_id=current_user.id, update_existing=True
+    )
+
+
+@router.get(
+    "/items", response_model=list[ItemRead], dependencies=[Depends(items_rate_limit)]
+)
+def list_items(
+    offset: int = Query(0, ge=0),
+    limit: int | None = Query(None, ge=1),
+    min_price: Decimal | None = Query(None, ge=0),
+    max_price: Decimal | None = Query(None, ge=0),
+    in_stock: bool | None = None,
+    min_rating: int | None = Query(None, ge=1, le=5),
+    category: str | None = None,
+    sort: ItemSort = "created_at",
+    if_none_match: str | None = Header(default=None),
+    db: Session = Depends(get_items_read_db),
+    current_user: User = Depends(get_current_user),
 ):
     """
     Retrieve a list of scraped items owned by the current user.
 
+    Returns 304 Not Modified when ``If-None-Match`` matches the collection
+    ETag. Serialized pages are cached per (user, version, query), so repeated
+    reads of an unchanged collection skip the query entirely. A cache miss
+    is read from the primary when the replica has not caught up with the
+    collection version yet, so a lagging body is never cached or tagged.
+
+    Filters and sorts run server-side on the per-owner price, rating and
+    category indexes. A leading ``-`` in ``sort`` means descending.
+
     Args:
+        offset (int): Number of items to skip.
+        limit (int | None): Maximum number of items to return (all if omitted).
+        min_price (Decimal | None): Only items priced at or above this.
+        max_price (Decimal | None): Only items priced at or below this.
+        in_stock (bool | None): Only items with (True) or without (False) stock.
+        min_rating (int | None): Only items rated at least this many stars.
+        category (str | None): Only items in this category.
+        sort (str): Sort column: created_at, price, rating or stock.
+        if_none_match (str | None): ETag(s) the client already holds.
         db (Session): SQLAlchemy database session dependency.
         current_user (User): Currently authenticated user.
 
     Returns:
         List[ItemRead]: List of scraped items.
     """
+    etag = collection_etag(current_user)
+    if etag_matches(if_none_match, etag):
+        return _not_modified(etag)
+
     logger.info("Items listed by user: %s", current_user.username)
-    return db.query(ScrapedItem).filter(ScrapedItem.owner_id == current_user.id).all()
+    key = (
+        current_user.id,
+        current_user.items_version,
+        offset,
+        limit,
+        min_price,
+        max_price,
+        in_stock,
+        min_rating,
+        category,
+        sort,
+    )
+    body = items_cache.get(key)
+    if body is None:
+        query = db.query(ScrapedItem).filter(ScrapedItem.owner_id == current_user.id)
+        if min_price is not None:
+            query = query.filter(ScrapedItem.price >= min_price)
+        if max_price is not None:
+            query = query.filter(ScrapedItem.price <= max_price)
+        if in_stock is True:
+            query = query.filter(ScrapedItem.stock > 0)
+        elif in_stock is False:
+            query = query.filter(ScrapedItem.stock == 0)
+        if min_rating is not None:
+            query = query.filter(ScrapedItem.rating >= min_rating)
+        if category is not None:
+            query = query.filter(ScrapedItem.category == category)
+
+        column = _SORT_COLUMNS[sort.lstrip("-")]
+        order = column.desc() if sort.startswith("-") else column.asc()
+        query = query.order_by(order, ScrapedItem.id).offset(offset)
+        if limit is not None:
+            query = query.limit(limit)
+        if _replica_caught_up(db, current_user):
+            body = _items_adapter.dump_json(query.all())
+        else:
+            with SessionLocal() as primary:
+                body = _items_adapter.dump_json(query.with_session(primary).all())
+        items_cache.set(key, body)
+    return _json(body, etag)
+
+
+# Declared before /items/{item_id} so "stats" is not parsed as an item ID.
+@router.get(
+    "/items/stats", response_model=ItemStats, dependencies=[Depends(items_rate_limit)]
+)
+def get_item_stats(
+    db: Session = Depends(get_items_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Summarize the current user's collection without scanning it.
+
+    Reads the user's single user_item_stats row, which ingest and deletes
+    keep up to date, so the cost does not depend on the number of items.
+
+    Args:
+        db (Session): SQLAlchemy database session dependency.
+        current_user (User): Currently authenticated user.
+
+    Returns:
+        ItemStats: Item count, description bytes and latest scrape details.
+    """
+    stats = db.get(UserItemStats, current_user.id)
+    if stats is None:
+        return ItemStats()
+    return stats
 
 
-@router.get("/items/{item_id}", response_model=ItemRead)
+@router.get(
+    "/items/{item_id}",
+    response_model=ItemRead,
+    dependencies=[Depends(items_rate_limit)],
+)
 def get_item(
     item_id: UUID,
-    db: Session = Depends(get_db),
+    if_none_match: str | None = Header(default=None),
+    db: Session = Depends(get_items_read_db),
     current_user: User = Depends(get_current_user),
 ):
     """
     Retrieve a specific scraped item by its ID if it belongs to the current user.
 
+    Returns 304 Not Modified when ``If-None-Match`` matches the item ETag.
+    The item is read from the primary when the replica has not caught up
+    with the collection version in the ETag yet.
+
     Args:
         item_id (UUID): The UUID of the item to retrieve.
+        if_none_match (str | None): ETag(s) the client already holds.
         db (Session): SQLAlchemy database session dependency.
         current_user (User): Currently authenticated user.
 
@@ -102,17 +464,89 @@ def get_item(
     Raises:
         HTTPException: 404 Not Found if the item does not exist or does not belong to the user.
     """
-    item = (
-        db.query(ScrapedItem)
-        .filter(ScrapedItem.id == item_id, ScrapedItem.owner_id == current_user.id)
-        .first()
+    etag = item_etag(current_user, item_id)
+    if etag_matches(if_none_match, etag):
+        return _not_modified(etag)
+
+    query = db.query(ScrapedItem).filter(
+        ScrapedItem.id == item_id, ScrapedItem.owner_id == current_user.id
     )
+    if _replica_caught_up(db, current_user):
+        item = query.first()
+    else:
+        with SessionLocal() as primary:
+            item = query.with_session(primary).first()
     if not item:
         raise HTTPException(status_code=404, detail="Item not found")
-    return item
+    return _json(_item_adapter.dump_json(item), etag)
+
+
+@router.get("/items/{item_id}/cover", dependencies=[Depends(items_rate_limit)])
+def get_item_cover(
+    item_id: UUID,
+    size: Literal["full", "thumb"] = "full",
+    if_none_match: str | None = Header(default=None),
+    db: Session = Depends(get_items_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Serve the cover image of an item from the asset store.
+
+    Covers are content-addressed, so the response carries the hash as a
+    strong ETag and may be cached for a year. The file is handed to the
+    server as a path, letting it use zero-copy transfer where supported.
+    ``size=thumb`` falls back to the original when no thumbnail exists; that
+    response carries the original's ETag and must be revalidated.
+
+    Args:
+        item_id (UUID): The UUID of the item whose cover to serve.
+        size (str): ``full`` for the original image, ``thumb`` for the thumbnail.
+        if_none_match (str | None): ETag(s) the client already holds.
+        db (Session): SQLAlchemy database session dependency.
+        current_user (User): Currently authenticated user.
+
+    Returns:
+        FileResponse: The image file.
+
+    Raises:
+        HTTPException: 404 Not Found if the item does not exist, does not
+            belong to the user, or has no stored cover.
+    """
+    from app.services.assets import get_asset_store
+
+    store = get_asset_store()
+    digest = (
+        db.query(ScrapedItem.cover_sha256)
+        .filter(ScrapedItem.id == item_id, ScrapedItem.owner_id == current_user.id)
+        .scalar()
+    )
+    if store is None or digest is None:
+        raise HTTPException(status_code=404, detail="Cover not found")
+
+    # A thumbnail that is not generated yet falls back to the original; that
+    # response is tagged as the original and revalidated, so the client picks
+    # up the thumbnail once it exists instead of caching the fallback.
+    thumbnail = store.thumbnail_path(digest)
+    if size == "thumb" and not os.path.exists(thumbnail):
+        size = "full"
+        cache_control = "private, no-cache"
+    else:
+        cache_control = "private, max-age=31536000, immutable"
+    etag = f'"{digest}-{size}"'
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    if size == "thumb":
+        return FileResponse(thumbnail, media_type="image/jpeg", headers=headers)
+    try:
+        media_type = store.media_type(digest)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Cover not found")
+    return FileResponse(store.path(digest), media_type=media_type, headers=headers)
 
 
-@router.delete("/items/{item_id}")
+@router.delete("/items/{item_id}", dependencies=[Depends(items_rate_limit)])
 def delete_item(
     item_id: UUID,
     db: Session = Depends(get_db),
@@ -132,15 +566,88 @@ def delete_item(
     Raises:
         HTTPException: 404 Not Found if the item does not exist or does not belong to the user.
     """
-    item = (
-        db.query(ScrapedItem)
-        .filter(ScrapedItem.id == item_id, ScrapedItem.owner_id == current_user.id)
-        .first()
+    deleted = delete_items(
+        db,
+        current_user.id,
+        delete(ScrapedItem).where(
+            ScrapedItem.id == item_id, ScrapedItem.owner_id == current_user.id
+        ),
     )
-    if not item:
+    if not deleted:
+        db.rollback()
         raise HTTPException(status_code=404, detail="Item not found")
 
-    db.delete(item)
+    bump_items_version(db, current_user.id)
     db.commit()
     logger.info("Item %s deleted by user %s", item_id, current_user.username)
     return {"status": "deleted"}
+
+
+@router.post(
+    "/items/batch-get",
+    response_model=ItemBatchRead,
+    dependencies=[Depends(items_rate_limit)],
+)
+def batch_get_items(
+    payload: ItemBatchGet,
+    db: Session = Depends(get_items_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Retrieve several items owned by the current user in a single query.
+
+    IDs that do not exist or belong to another user are silently omitted.
+
+    Args:
+        payload (ItemBatchGet): IDs of the items to retrieve.
+        db (Session): SQLAlchemy database session dependency.
+        current_user (User): Currently authenticated user.
+
+    Returns:
+        ItemBatchRead: Found items and their count.
+    """
+    items = (
+        db.query(ScrapedItem)
+        .filter(
+            ScrapedItem.owner_id == current_user.id,
+            ScrapedItem.id.in_(set(payload.ids)),
+        )
+        .all()
+    )
+    return {"items": items, "count": len(items)}
+
+
+@router.delete("/items", dependencies=[Depends(items_rate_limit)])
+def bulk_delete_items(
+    payload: ItemBulkDelete,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Delete items owned by the current user in a single statement.
+
+    Criteria are combined with AND: an ID list, items created before a
+    timestamp, and/or items whose URL starts with a prefix.
+
+    Args:
+        payload (ItemBulkDelete): Deletion criteria; at least one is required.
+        db (Session): SQLAlchemy database session dependency.
+        current_user (User): Currently authenticated user.
+
+    Returns:
+        dict: Status message and number of deleted items.
+    """
+    stmt = delete(ScrapedItem).where(ScrapedItem.owner_id == current_user.id)
+    if payload.ids is not None:
+        stmt = stmt.where(ScrapedItem.id.in_(set(payload.ids)))
+    if payload.created_before is not None:
+        stmt = stmt.where(ScrapedItem.created_at < payload.created_before)
+    if payload.url_prefix is not None:
+        stmt = stmt.where(ScrapedItem.url.startswith(payload.url_prefix, autoescape=True))
+
+    deleted = delete_items(db, current_user.id, stmt)
+    if deleted:
+        bump_items_version(db, current_user.id)
+    db.commit()
+    logger.info("%s items deleted by user %s", deleted, current_user.username)
+    return {"status": "deleted", "deleted": deleted}
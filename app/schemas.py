@@ -1,6 +1,9 @@
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 from uuid import UUID
 from datetime import datetime
+from decimal import Decimal
+
+MAX_BATCH_IDS = 1000
 
 
 class ItemRead(BaseModel):
@@ -9,10 +12,46 @@ class ItemRead(BaseModel):
     description: str | None = None
     url: str
     created_at: datetime | None = None
+    price: Decimal | None = None
+    stock: int | None = None
+    rating: int | None = None
+    upc: str | None = None
+    category: str | None = None
+    cover_sha256: str | None = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ItemStats(BaseModel):
+    item_count: int = 0
+    description_bytes: int = 0
+    last_scraped_at: datetime | None = None
+    last_scrape_inserted: int | None = None
 
     model_config = ConfigDict(from_attributes=True)
 
 
+class ItemBatchGet(BaseModel):
+    ids: list[UUID] = Field(min_length=1, max_length=MAX_BATCH_IDS)
+
+
+class ItemBatchRead(BaseModel):
+    items: list[ItemRead]
+    count: int
+
+
+class ItemBulkDelete(BaseModel):
+    ids: list[UUID] | None = Field(default=None, min_length=1, max_length=MAX_BATCH_IDS)
+    created_before: datetime | None = None
+    url_prefix: str | None = Field(default=None, min_length=1)
+
+    @model_validator(mode="after")
+    def require_criterion(self):
+        if self.ids is None and self.created_before is None and self.url_prefix is None:
+            raise ValueError("Provide ids, created_before or url_prefix")
+        return self
+
+
 class Token(BaseModel):
     access_token: str
     token_type: str = "bearer"
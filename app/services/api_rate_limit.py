@@ -0,0 +1,221 @@
+"""
+Per-user API rate limiting with token buckets.
+
+Each (route scope, user) pair owns a bucket that holds up to ``capacity``
+tokens and refills at ``rate`` tokens per second; every request takes one.
+Buckets live in a pluggable backend:
+
+- memory: in-process dict; fastest, but each worker enforces its own limit.
+- postgres: one atomic upsert per request against the UNLOGGED
+  ``rate_limit_buckets`` table, shared by all workers. Costs a database
+  round trip (about 0.3 ms on a local socket, see benchmarks.rate_limit)
+  on a small autocommit pool separate from the request's.
+
+Limits are applied as FastAPI dependencies. Rejected requests get a 429 with
+``Retry-After``; every limited request carries ``X-RateLimit-Limit``,
+``X-RateLimit-Remaining`` and ``X-RateLimit-Reset`` (added by the
+``rate_limit_headers`` middleware from ``request.state``).
+
+Functions:
+- get_backend: Return the configured backend.
+- rate_limit: Build a dependency enforcing a bucket for a route scope.
+"""
+
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from fastapi import Depends, HTTPException, Request, status
+from sqlalchemy import text
+
+from app.core.config import get_settings
+from app.core.database import get_rate_limit_engine
+from app.database.models import User
+from app.services.auth_service import get_current_user
+
+
+@dataclass
+class RateLimitResult:
+    """
+    Outcome of taking a token from a bucket.
+
+    Attributes:
+        allowed (bool): Whether the request may proceed.
+        limit (int): Bucket capacity.
+        remaining (int): Whole tokens left after this request.
+        reset_after (float): Seconds until the bucket is full again.
+        retry_after (float): Seconds until a token is available (0 if allowed).
+    """
+
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_after: float
+    retry_after: float
+
+    def headers(self) -> Dict[str, str]:
+        """Return the X-RateLimit-* (and Retry-After when denied) headers."""
+        headers = {
+            "X-RateLimit-Limit": str(self.limit),
+            "X-RateLimit-Remaining": str(self.remaining),
+            "X-RateLimit-Reset": str(math.ceil(self.reset_after)),
+        }
+        if not self.allowed:
+            headers["Retry-After"] = str(max(1, math.ceil(self.retry_after)))
+        return headers
+
+
+def _result(allowed: bool, tokens: float, capacity: int, rate: float) -> RateLimitResult:
+    """Build a RateLimitResult from the bucket level after the request."""
+    return RateLimitResult(
+        allowed=allowed,
+        limit=capacity,
+        remaining=max(0, int(tokens)),
+        reset_after=max(0.0, (capacity - tokens) / rate),
+        retry_after=0.0 if allowed else max(0.0, (1 - tokens) / rate),
+    )
+
+
+class InMemoryBackend:
+    """Token buckets held in a process-local dict."""
+
+    def __init__(self):
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def take(self, key: str, capacity: int, rate: float) -> RateLimitResult:
+        """
+        Take one token from the bucket identified by ``key``.
+
+        Args:
+            key (str): Bucket identifier.
+            capacity (int): Maximum number of tokens (burst size).
+            rate (float): Refill rate in tokens per second.
+
+        Returns:
+            RateLimitResult: Whether the request is allowed and bucket state.
+        """
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated) * rate)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            self._buckets[key] = (tokens, now)
+        return _result(allowed, tokens, capacity, rate)
+
+
+# Refill, check and deduct in one statement. Written as text() so the
+# compiled form is cached: the dialect insert construct is recompiled on
+# every call, which cost more than the round trip itself.
+_TAKE = text(
+    """
+    INSERT INTO rate_limit_buckets AS b (key, tokens, allowed, updated_at)
+    VALUES (:key, :capacity - 1, true, now())
+    ON CONFLICT (key) DO UPDATE SET
+        tokens = least(:capacity, b.tokens
+                       + extract(epoch FROM now() - b.updated_at) * :rate)
+                 - CASE WHEN least(:capacity, b.tokens
+                                   + extract(epoch FROM now() - b.updated_at) * :rate)
+                             >= 1 THEN 1 ELSE 0 END,
+        allowed = least(:capacity, b.tokens
+                        + extract(epoch FROM now() - b.updated_at) * :rate) >= 1,
+        updated_at = now()
+    RETURNING tokens, allowed
+    """
+)
+
+
+class PostgresBackend:
+    """Token buckets stored in Postgres, updated with one atomic upsert."""
+
+    def take(self, key: str, capacity: int, rate: float) -> RateLimitResult:
+        """
+        Take one token from the bucket identified by ``key``.
+
+        The refill, the check and the deduction happen in a single
+        ``INSERT ... ON CONFLICT DO UPDATE``, so concurrent workers cannot
+        overspend a bucket. Runs in autocommit mode on the rate limiter's
+        own engine, so it is one round trip and never competes with the
+        request's session for a primary connection.
+
+        Args:
+            key (str): Bucket identifier.
+            capacity (int): Maximum number of tokens (burst size).
+            rate (float): Refill rate in tokens per second.
+
+        Returns:
+            RateLimitResult: Whether the request is allowed and bucket state.
+        """
+        with get_rate_limit_engine().connect() as conn:
+            tokens, allowed = conn.execute(
+                _TAKE, {"key": key, "capacity": capacity, "rate": rate}
+            ).one()
+        return _result(bool(allowed), float(tokens), capacity, rate)
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_backend():
+    """
+    Return the process-wide backend selected by RATE_LIMIT_BACKEND.
+
+    Returns:
+        InMemoryBackend | PostgresBackend: The bucket backend.
+    """
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                if get_settings().rate_limit_backend == "postgres":
+                    _backend = PostgresBackend()
+                else:
+                    _backend = InMemoryBackend()
+    return _backend
+
+
+def rate_limit(scope: str):
+    """
+    Build a dependency enforcing the per-user bucket of a route scope.
+
+    Args:
+        scope (str): Limit scope, ``"scrape"`` or ``"items"``.
+
+    Returns:
+        Callable: FastAPI dependency raising 429 when the bucket is empty.
+    """
+
+    def dependency(
+        request: Request, current_user: User = Depends(get_current_user)
+    ) -> Optional[RateLimitResult]:
+        settings = get_settings()
+        if not settings.rate_limit_enabled:
+            return None
+        if scope == "scrape":
+            capacity = settings.scrape_rate_burst
+            rate = settings.scrape_rate_per_hour / 3600
+        else:
+            capacity = settings.items_rate_burst
+            rate = settings.items_rate_per_minute / 60
+
+        result = get_backend().take(f"{scope}:{current_user.id}", capacity, rate)
+        request.state.rate_limit = result
+        if not result.allowed:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Rate limit exceeded",
+                headers=result.headers(),
+            )
+        return result
+
+    dependency.__name__ = f"{scope}_rate_limit"
+    return dependency
+
+
+scrape_rate_limit = rate_limit("scrape")
+items_rate_limit = rate_limit("items")
@@ -0,0 +1,94 @@
+"""
+Content-addressed archive of raw fetched pages.
+
+Pages are stored zstd-compressed under their SHA-256 hash, so identical
+bodies fetched from different URLs or scrapes are stored once. An
+append-only ``index.jsonl`` maps each URL to the hash of its latest body;
+the last line for a URL wins (see content_store.ContentStore).
+
+Layout::
+
+    <root>/objects/ab/abcdef....html.zst
+    <root>/index.jsonl
+
+The archive is enabled by setting SCRAPER_ARCHIVE_DIR and requires the
+``zstandard`` package.
+
+Classes:
+- PageArchive: Store and load archived pages.
+
+Functions:
+- get_archive: Return the configured archive, or None when disabled.
+"""
+
+import logging
+import os
+import threading
+from typing import Optional
+
+from app.services.content_store import ContentStore
+
+ARCHIVE_DIR = os.getenv("SCRAPER_ARCHIVE_DIR", "")
+ARCHIVE_LEVEL = int(os.getenv("SCRAPER_ARCHIVE_ZSTD_LEVEL", "10"))
+
+logger = logging.getLogger(__name__)
+
+
+class PageArchive(ContentStore):
+    """
+    Content-addressed, zstd-compressed page store with a URL index.
+
+    Args:
+        root (str): Directory holding the archive.
+        level (int): zstd compression level.
+    """
+
+    def __init__(self, root: str, level: int = ARCHIVE_LEVEL):
+        import zstandard
+
+        super().__init__(root)
+        self._compressor = zstandard.ZstdCompressor(level=level)
+        self._decompressor = zstandard.ZstdDecompressor()
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.objects_dir, digest[:2], f"{digest}.html.zst")
+
+    def _encode(self, body: bytes) -> bytes:
+        return self._compressor.compress(body)
+
+    def get(self, digest: str) -> bytes:
+        """
+        Load an archived body by hash.
+
+        Raises:
+            FileNotFoundError: If no object exists for the hash.
+        """
+        with open(self._object_path(digest), "rb") as f:
+            return self._decompressor.decompress(f.read())
+
+    def get_url(self, url: str) -> Optional[bytes]:
+        """Load the latest archived body for a URL, or None if not archived."""
+        with self._lock:
+            digest = self._load_index().get(url)
+        return self.get(digest) if digest else None
+
+
+_archive: Optional[PageArchive] = None
+_archive_lock = threading.Lock()
+
+
+def get_archive() -> Optional[PageArchive]:
+    """
+    Return the process-wide archive if SCRAPER_ARCHIVE_DIR is set.
+
+    Returns:
+        PageArchive | None: The archive, or None when archiving is disabled.
+    """
+    global _archive
+    if not ARCHIVE_DIR:
+        return None
+    with _archive_lock:
+        if _archive is None:
+            _archive = PageArchive(ARCHIVE_DIR)
+            logger.info("Page archive enabled at %s", ARCHIVE_DIR)
+        return _archive
@@ -0,0 +1,132 @@
+"""
+Content-addressed store for downloaded product assets (cover images).
+
+Images are stored under the SHA-256 hash of their bytes, so a cover shared
+by many users (or served from several URLs) is kept once. An append-only
+``index.jsonl`` maps each image URL to its hash (see
+content_store.ContentStore); a URL already in the index is not downloaded
+again, whichever user's scrape saw it first.
+JPEG thumbnails are derived per hash.
+
+Layout::
+
+    <root>/objects/ab/abcdef...
+    <root>/thumbs/ab/abcdef....jpg
+    <root>/index.jsonl
+
+The store is enabled by setting SCRAPER_ASSET_DIR. Thumbnails require the
+optional ``Pillow`` package; without it only originals are stored.
+
+Classes:
+- AssetStore: Store, look up and thumbnail assets.
+
+Functions:
+- get_asset_store: Return the configured store, or None when disabled.
+"""
+
+import io
+import logging
+import os
+import threading
+from typing import Optional
+
+from app.services.content_store import ContentStore, write_atomic
+
+ASSET_DIR = os.getenv("SCRAPER_ASSET_DIR", "")
+ASSET_WORKERS = int(os.getenv("SCRAPER_ASSET_WORKERS", "4"))
+THUMBNAIL_WORKERS = int(os.getenv("SCRAPER_THUMBNAIL_WORKERS") or os.cpu_count() or 2)
+THUMBNAIL_PX = int(os.getenv("SCRAPER_THUMBNAIL_PX", "200"))
+
+_MAGIC = (
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"GIF8", "image/gif"),
+    (b"RIFF", "image/webp"),
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AssetStore(ContentStore):
+    """
+    Content-addressed image store with a URL index and thumbnails.
+
+    Args:
+        root (str): Directory holding the store.
+        thumbnail_px (int): Longest side of generated thumbnails.
+    """
+
+    def __init__(self, root: str, thumbnail_px: int = THUMBNAIL_PX):
+        super().__init__(root)
+        self.thumbnail_px = thumbnail_px
+        self.thumbs_dir = os.path.join(root, "thumbs")
+
+    def path(self, digest: str) -> str:
+        """Return the path of the original asset for a hash."""
+        return self._object_path(digest)
+
+    def thumbnail_path(self, digest: str) -> str:
+        """Return the path of the JPEG thumbnail for a hash."""
+        return os.path.join(self.thumbs_dir, digest[:2], f"{digest}.jpg")
+
+    def media_type(self, digest: str) -> str:
+        """Sniff the image type of a stored asset from its first bytes."""
+        with open(self.path(digest), "rb") as f:
+            head = f.read(12)
+        for magic, media_type in _MAGIC:
+            if head.startswith(magic):
+                return media_type
+        return "application/octet-stream"
+
+    def make_thumbnail(self, digest: str) -> bool:
+        """
+        Generate the JPEG thumbnail for a stored asset if it does not exist.
+
+        Pillow releases the GIL while decoding and resizing, so this can run
+        in a thread pool alongside the downloads.
+
+        Args:
+            digest (str): Hash of the stored asset.
+
+        Returns:
+            bool: True if a thumbnail exists afterwards.
+        """
+        target = self.thumbnail_path(digest)
+        if os.path.exists(target):
+            return True
+        try:
+            from PIL import Image
+        except ImportError:
+            return False
+
+        try:
+            with Image.open(self.path(digest)) as image:
+                image.thumbnail((self.thumbnail_px, self.thumbnail_px))
+                buffer = io.BytesIO()
+                image.convert("RGB").save(buffer, "JPEG", quality=85, optimize=True)
+        except (OSError, ValueError) as e:
+            logger.warning("Thumbnail failed for %s: %s", digest, e)
+            return False
+        write_atomic(target, buffer.getvalue())
+        return True
+
+
+_store: Optional[AssetStore] = None
+_store_lock = threading.Lock()
+
+
+def get_asset_store() -> Optional[AssetStore]:
+    """
+    Return the process-wide asset store if SCRAPER_ASSET_DIR is set.
+
+    Returns:
+        AssetStore | None: The store, or None when asset downloads are disabled.
+    """
+    global _store
+    if not ASSET_DIR:
+        return None
+    with _store_lock:
+        if _store is None:
+            _store = AssetStore(ASSET_DIR)
+            logger.info("Asset store enabled at %s", ASSET_DIR)
+        return _store
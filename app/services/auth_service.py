@@ -3,29 +3,32 @@ Authentication service utilities for the Web Scraper API.
 
 Includes functions for password hashing and verification,
 JWT token creation, and current user retrieval from tokens.
+
+passlib/bcrypt and python-jose are imported on first use rather than at
+module import, keeping application startup fast.
 """
 
+from functools import lru_cache
+
 from fastapi import Depends, HTTPException, status
-from passlib.context import CryptContext
 from datetime import datetime, timedelta
-from jose import jwt, JWTError, ExpiredSignatureError
 from fastapi.security import OAuth2PasswordBearer
-import os
-
-from requests import Session
+from sqlalchemy.orm import Session
 
+from app.core.config import get_settings
 from app.core.database import get_db
 from app.database.models import User
 
-REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "7"))
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-SECRET_KEY = os.getenv("SECRET_KEY")
-ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
-ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "60"))
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
-REFRESH_SECRET_KEY = os.getenv("REFRESH_SECRET_KEY", SECRET_KEY)
 
 
+@lru_cache(maxsize=1)
+def _pwd_context():
+    """Build the bcrypt password context on first use."""
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
+
 
 def verify_password(plain: str, hashed: str) -> bool:
     """
@@ -38,7 +41,7 @@ def verify_password(plain: str, hashed: str) -> bool:
     Returns:
         bool: True if passwords match, False otherwise.
     """
-    return pwd_context.verify(plain, hashed)
+    return _pwd_context().verify(plain, hashed)
 
 
 def get_password_hash(password: str) -> str:
@@ -51,7 +54,7 @@ def get_password_hash(password: str) -> str:
     Returns:
         str: Hashed password.
     """
-    return pwd_context.hash(password)
+    return _pwd_context().hash(password)
 
 
 def create_access_token(subject: str, expires_delta: timedelta | None = None) -> str:
@@ -65,12 +68,15 @@ def create_access_token(subject: str, expires_delta: timedelta | None = None) ->
     Returns:
         str: Encoded JWT token.
     """
+    from jose import jwt
+
+    settings = get_settings()
     to_encode = {"sub": subject}
     expire = datetime.utcnow() + (
-        expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+        expires_delta or timedelta(minutes=settings.access_token_expire_minutes)
     )
     to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    return jwt.encode(to_encode, settings.secret_key, algorithm=settings.jwt_algorithm)
 
 
 def get_current_user(
@@ -90,7 +96,10 @@ def get_current_user(
     Raises:
         HTTPException: 401 Unauthorized if token is invalid or user not found.
     """
-    payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    from jose import jwt
+
+    settings = get_settings()
+    payload = jwt.decode(token, settings.secret_key, algorithms=[settings.jwt_algorithm])
     username: str = payload.get("sub")
     if not username:
         raise HTTPException(401, "Invalid token")
@@ -113,23 +122,35 @@ def anonymous_only(user=Depends(get_current_user)):
         )
 
 def create_access_token(subject: str, expires_delta: timedelta | None = None) -> str:
-    expire = datetime.utcnow() + (expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
+    from jose import jwt
+
+    settings = get_settings()
+    expire = datetime.utcnow() + (expires_delta or timedelta(minutes=settings.access_token_expire_minutes))
     to_encode = {"sub": subject, "exp": expire, "type": "access"}
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    return jwt.encode(to_encode, settings.secret_key, algorithm=settings.jwt_algorithm)
 
 def create_refresh_token(subject: str, expires_days: int | None = None) -> str:
-    expire = datetime.utcnow() + timedelta(days=expires_days or REFRESH_TOKEN_EXPIRE_DAYS)
+    from jose import jwt
+
+    settings = get_settings()
+    expire = datetime.utcnow() + timedelta(days=expires_days or settings.refresh_token_expire_days)
     to_encode = {"sub": subject, "exp": expire, "type": "refresh"}
-    return jwt.encode(to_encode, REFRESH_SECRET_KEY, algorithm=ALGORITHM)
+    return jwt.encode(to_encode, settings.refresh_secret_key, algorithm=settings.jwt_algorithm)
 
 def verify_access_token(token: str) -> dict:
-    payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    from jose import jwt, JWTError
+
+    settings = get_settings()
+    payload = jwt.decode(token, settings.secret_key, algorithms=[settings.jwt_algorithm])
     if payload.get("type") != "access":
         raise JWTError("Invalid token type")
     return payload
 
 def verify_refresh_token(token: str) -> dict:
-    payload = jwt.decode(token, REFRESH_SECRET_KEY, algorithms=[ALGORITHM])
+    from jose import jwt, JWTError
+
+    settings = get_settings()
+    payload = jwt.decode(token, settings.refresh_secret_key, algorithms=[settings.jwt_algorithm])
     if payload.get("type") != "refresh":
         raise JWTError("Invalid token type")
     return payload
@@ -0,0 +1,153 @@
+"""
+Content-addressed file store with an append-only URL index.
+
+Bodies are stored under the SHA-256 hash of their bytes, so identical
+content fetched from different URLs or scrapes is kept once. An
+append-only ``index.jsonl`` maps each URL to the hash of its latest body;
+the last line for a URL wins. Several processes may share a store: objects
+are written atomically and each process picks up index lines appended by
+the others.
+
+Layout::
+
+    <root>/objects/ab/abcdef...
+    <root>/index.jsonl
+
+Subclasses choose the object file name and how bodies are encoded on disk
+(see archive.PageArchive and assets.AssetStore).
+
+Classes:
+- ContentStore: Store bodies by hash and map URLs to them.
+
+Functions:
+- write_atomic: Write a file via a temporary file and rename.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def write_atomic(path: str, data: bytes) -> None:
+    """Write ``data`` to ``path`` via a temporary file and rename."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+class ContentStore:
+    """
+    Content-addressed object store with a URL index.
+
+    Args:
+        root (str): Directory holding the store.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self.objects_dir = os.path.join(root, "objects")
+        self.index_path = os.path.join(root, "index.jsonl")
+        os.makedirs(self.objects_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self._index: Dict[str, str] = {}
+        self._index_offset = 0
+
+    def _object_path(self, digest: str) -> str:
+        """Return the path of the object stored for a hash."""
+        return os.path.join(self.objects_dir, digest[:2], digest)
+
+    def _encode(self, body: bytes) -> bytes:
+        """Return the bytes written to disk for a body."""
+        return body
+
+    def _load_index(self) -> Dict[str, str]:
+        """
+        Return the URL index, reading lines appended since the last call.
+
+        Other processes (workers) append to index.jsonl too, so the file is
+        re-checked on every call and only its new complete lines are parsed.
+        Callers hold ``self._lock``.
+        """
+        try:
+            size = os.path.getsize(self.index_path)
+        except FileNotFoundError:
+            return self._index
+        if size <= self._index_offset:
+            return self._index
+        with open(self.index_path, "rb") as f:
+            f.seek(self._index_offset)
+            chunk = f.read(size - self._index_offset)
+        # A line still being written by another process is read next time.
+        complete = chunk[: chunk.rfind(b"\n") + 1]
+        self._index_offset += len(complete)
+        for line in complete.decode("utf-8").splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                logger.warning("Skipping corrupt index line in %s", self.index_path)
+                continue
+            self._index[entry["url"]] = entry["sha256"]
+        return self._index
+
+    def lookup(self, url: str) -> Optional[str]:
+        """Return the hash stored for a URL, or None if it has not been stored."""
+        with self._lock:
+            digest = self._load_index().get(url)
+        if digest and os.path.exists(self._object_path(digest)):
+            return digest
+        return None
+
+    def put(self, url: str, body: bytes) -> str:
+        """
+        Store a body fetched from a URL.
+
+        The object is written only if its hash is new, and the index is
+        appended only if the URL now points at a different hash.
+
+        Args:
+            url (str): URL the body was fetched from.
+            body (bytes): Raw response body.
+
+        Returns:
+            str: SHA-256 hex digest of the body.
+        """
+        digest = hashlib.sha256(body).hexdigest()
+        path = self._object_path(digest)
+        if not os.path.exists(path):
+            write_atomic(path, self._encode(body))
+
+        with self._lock:
+            index = self._load_index()
+            if index.get(url) != digest:
+                entry = {
+                    "url": url,
+                    "sha256": digest,
+                    "fetched_at": datetime.now(timezone.utc).isoformat(),
+                }
+                with open(self.index_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(entry) + "\n")
+                index[url] = digest
+        return digest
+
+    def entries(self) -> Iterator[Tuple[str, str]]:
+        """Yield (url, sha256) pairs for the latest body of every stored URL."""
+        with self._lock:
+            items = list(self._load_index().items())
+        yield from items
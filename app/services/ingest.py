@@ -1,27 +1,152 @@
+from itertools import islice
+
+from sqlalchemy import Integer, Numeric, SmallInteger, String, Text, cast, column
+from sqlalchemy import func, literal_column, update, values
 from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import aliased
+from app.core.config import get_settings
 from app.database.models import ScrapedItem
+from app.services.item_cache import bump_items_version
+from app.services.item_stats import record_item_changes
 import uuid
 
+_UPDATE_COLUMNS = (
+    ("url", String),
+    ("title", String),
+    ("description", Text),
+    ("price", Numeric(10, 2)),
+    ("stock", Integer),
+    ("rating", SmallInteger),
+    ("upc", String(32)),
+    ("category", String),
+    ("cover_sha256", String(64)),
+)
+
+
+def _update_existing(rows, db, owner_id):
+    """
+    Refresh the fields of items the owner already has; never insert.
+
+    Runs one ``UPDATE ... FROM (VALUES ...)`` joined to the pre-update rows,
+    so URLs the owner does not own (never scraped, or deleted) are ignored
+    and the description size change comes back with the updated rows.
+
+    Returns:
+        list[tuple[int, int]]: (new size, old size) of each updated description.
+    """
+    new = values(
+        *(column(name, type_) for name, type_ in _UPDATE_COLUMNS), name="new"
+    ).data([tuple(row[name] for name, _ in _UPDATE_COLUMNS) for row in rows])
+    old = aliased(ScrapedItem, name="old")
+
+    def size(entity):
+        return func.coalesce(func.octet_length(entity.description), 0)
+
+    stmt = (
+        update(ScrapedItem)
+        .where(
+            ScrapedItem.owner_id == owner_id,
+            ScrapedItem.url == new.c.url,
+            old.id == ScrapedItem.id,
+        )
+        .values(
+            title=new.c.title,
+            description=cast(new.c.description, Text),
+            price=cast(new.c.price, Numeric(10, 2)),
+            stock=cast(new.c.stock, Integer),
+            rating=cast(new.c.rating, SmallInteger),
+            upc=cast(new.c.upc, String),
+            category=cast(new.c.category, String),
+            cover_sha256=func.coalesce(
+                cast(new.c.cover_sha256, String), ScrapedItem.cover_sha256
+            ),
+        )
+        .returning(size(ScrapedItem), size(old))
+    )
+    return db.execute(stmt).all()
+
+
+def ingest_items(items, db, owner_id, update_existing=False, scraped_at=None):
+    """
+    Insert a batch of items, or refresh existing ones, and update the owner's stats.
+
+    By default new URLs are inserted and known ones skipped. With
+    ``update_existing`` only items the owner already has are updated;
+    nothing is inserted. The item rows, the collection version bump and the
+    user_item_stats delta are committed together. Pass ``scraped_at`` (the
+    scrape's start time, shared by all its batches) to record the batch as
+    scrape output.
 
-def ingest_items(items, db, owner_id):
+    Returns:
+        dict: Number of rows inserted and updated.
+    """
     rows = []
     for it in items:
         rows.append(
             {
                 "id": uuid.uuid4(),
-                "title": it["title"],
-                "description": it.get("description", ""),
-                "url": it["url"],
+                "title": it.title,
+                "description": it.description,
+                "url": it.url,
+                "price": it.price,
+                "stock": it.stock,
+                "rating": it.rating,
+                "upc": it.upc,
+                "category": it.category,
+                "cover_sha256": it.cover_sha256,
                 "owner_id": owner_id,
             }
         )
 
-    stmt = (
-        pg_insert(ScrapedItem)
-        .values(rows)
-        .on_conflict_do_nothing(index_elements=["owner_id", "url"])
-    )
+    if not rows:
+        return {"inserted": 0, "updated": 0}
 
-    result = db.execute(stmt)
+    if update_existing:
+        sizes = _update_existing(rows, db, owner_id)
+        inserted, updated = 0, len(sizes)
+    else:
+        size = func.coalesce(func.octet_length(ScrapedItem.description), 0)
+        stmt = (
+            pg_insert(ScrapedItem)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=["owner_id", "url"])
+            .returning(size, literal_column("0"))
+        )
+        sizes = db.execute(stmt).all()
+        inserted, updated = len(sizes), 0
+
+    if sizes:
+        bump_items_version(db, owner_id)
+    if sizes or scraped_at is not None:
+        record_item_changes(
+            db,
+            owner_id,
+            inserted,
+            sum(new - old for new, old in sizes),
+            scraped_at=scraped_at,
+        )
     db.commit()
-    return {"inserted": result.rowcount}
+    return {"inserted": inserted, "updated": updated}
+
+
+def ingest_stream(
+    items, db, owner_id, batch_size=None, update_existing=False, scraped_at=None
+):
+    """
+    Ingest an iterable of items in batches, committing after each batch.
+
+    Returns:
+        dict: Total rows inserted and updated, and number of batches.
+    """
+    batch_size = batch_size or get_settings().ingest_batch_size
+    items = iter(items)
+    inserted = updated = batches = 0
+    while True:
+        batch = list(islice(items, batch_size))
+        if not batch:
+            break
+        result = ingest_items(batch, db, owner_id, update_existing, scraped_at)
+        inserted += result["inserted"]
+        updated += result["updated"]
+        batches += 1
+    return {"inserted": inserted, "updated": updated, "batches": batches}
@@ -0,0 +1,155 @@
+"""
+Per-user collection versioning, ETags and serialized response caching.
+
+Each user row carries an ``items_version`` counter that is bumped in the same
+transaction as any change to the user's items. Because the current user is
+already loaded for authentication, comparing a client's ``If-None-Match``
+against the version costs no extra query.
+
+Functions:
+- bump_items_version: Increment a user's collection version.
+- collection_etag / item_etag: Build weak ETags from the version.
+- etag_matches: Check an If-None-Match header against an ETag.
+
+Classes:
+- ItemsCache: Count- and byte-bounded LRU of serialized JSON pages keyed by
+  (user, version, page).
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Hashable, Optional
+from uuid import UUID
+
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.database.models import User
+
+
+def bump_items_version(db: Session, owner_id: UUID) -> None:
+    """
+    Increment the collection version of a user without committing.
+
+    Also stamps ``items_updated_at`` so the user's next reads are served by
+    the primary (read-your-writes).
+
+    Args:
+        db (Session): SQLAlchemy session holding the write transaction.
+        owner_id (UUID): ID of the user whose items changed.
+    """
+    db.execute(
+        update(User)
+        .where(User.id == owner_id)
+        .values(items_version=User.items_version + 1, items_updated_at=func.now())
+    )
+
+
+def collection_etag(user: User) -> str:
+    """Return the weak ETag for a user's item collection."""
+    return f'W/"{user.id}-{user.items_version}"'
+
+
+def item_etag(user: User, item_id: UUID) -> str:
+    """Return the weak ETag for a single item in a user's collection."""
+    return f'W/"{item_id}-{user.items_version}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check whether an If-None-Match header matches an ETag (weak comparison).
+
+    Args:
+        if_none_match (str | None): Raw If-None-Match header value.
+        etag (str): Current ETag of the resource.
+
+    Returns:
+        bool: True if the client's copy is current.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        if candidate.strip().removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+class ItemsCache:
+    """
+    Thread-safe LRU cache of serialized JSON responses.
+
+    Keys embed the collection version, so entries become unreachable as soon
+    as the version is bumped and age out of the LRU without explicit
+    invalidation. The cache is bounded by both entry count and total body
+    bytes: an unpaginated page holds a whole collection, so the count alone
+    does not bound memory. A body larger than the byte budget is not cached.
+
+    Args:
+        maxsize (int | None): Maximum number of cached pages; 0 disables
+            caching. Defaults to the ITEMS_CACHE_SIZE setting, read on first use.
+        max_bytes (int | None): Maximum total size of cached bodies; 0
+            disables caching. Defaults to the ITEMS_CACHE_BYTES setting.
+    """
+
+    def __init__(self, maxsize: Optional[int] = None, max_bytes: Optional[int] = None):
+        self._maxsize = maxsize
+        self._max_bytes = max_bytes
+        self._data: "OrderedDict[Hashable, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        """Maximum number of cached pages."""
+        if self._maxsize is None:
+            self._maxsize = get_settings().items_cache_size
+        return self._maxsize
+
+    @property
+    def max_bytes(self) -> int:
+        """Maximum total size of cached bodies in bytes."""
+        if self._max_bytes is None:
+            self._max_bytes = get_settings().items_cache_bytes
+        return self._max_bytes
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        """Return the cached body for ``key`` or None."""
+        if self.maxsize <= 0 or self.max_bytes <= 0:
+            return None
+        with self._lock:
+            body = self._data.get(key)
+            if body is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return body
+
+    def set(self, key: Hashable, body: bytes) -> None:
+        """Store ``body`` under ``key``, evicting least recently used entries."""
+        if self.maxsize <= 0 or len(body) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self.bytes -= len(old)
+            self._data[key] = body
+            self.bytes += len(body)
+            while len(self._data) > self.maxsize or self.bytes > self.max_bytes:
+                _, evicted = self._data.popitem(last=False)
+                self.bytes -= len(evicted)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._data.clear()
+            self.bytes = 0
+
+
+items_cache = ItemsCache()
@@ -0,0 +1,239 @@
+"""
+Incrementally maintained per-user collection statistics.
+
+Each user has at most one ``user_item_stats`` row holding the item count,
+total description bytes and the time and yield of their latest scrape.
+Ingest and the delete routes apply their deltas to it in the same
+transaction as the item change, so GET /items/stats is a single primary
+key lookup however large the collection is.
+
+The row can drift only if items are changed outside these paths (manual
+SQL, restores). ``python -m app.services.item_stats`` reports drift, and
+``--fix`` rebuilds the rows from scraped_items.
+
+Functions:
+- record_item_changes: Apply an item count / bytes delta (and scrape) to a user's row.
+- deleted_totals: Wrap an item DELETE to return the removed count and bytes.
+- delete_items: Run an item DELETE and record the removed rows.
+- find_drift / rebuild_item_stats: Consistency check and rebuild.
+"""
+
+import argparse
+from datetime import datetime
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import case, func, literal_column, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.database.models import ScrapedItem, User, UserItemStats
+
+_description_bytes = func.coalesce(
+    func.octet_length(ScrapedItem.description), literal_column("0")
+)
+
+
+def record_item_changes(
+    db: Session,
+    owner_id: UUID,
+    count_delta: int,
+    bytes_delta: int,
+    scraped_at: Optional[datetime] = None,
+) -> None:
+    """
+    Apply item changes to a user's stats row without committing.
+
+    Args:
+        db (Session): SQLAlchemy session holding the write transaction.
+        owner_id (UUID): ID of the user whose items changed.
+        count_delta (int): Items added (positive) or removed (negative).
+        bytes_delta (int): Description bytes added or removed.
+        scraped_at (datetime | None): Start time of the scrape that inserted
+            the items. Batches sharing a start time add up to one scrape in
+            ``last_scrape_inserted``; None for deletes.
+    """
+    stats = UserItemStats.__table__.c
+    stmt = pg_insert(UserItemStats).values(
+        user_id=owner_id,
+        item_count=max(count_delta, 0),
+        description_bytes=max(bytes_delta, 0),
+        last_scraped_at=scraped_at,
+        last_scrape_inserted=count_delta if scraped_at is not None else None,
+    )
+    set_ = {
+        "item_count": stats.item_count + count_delta,
+        "description_bytes": stats.description_bytes + bytes_delta,
+    }
+    if scraped_at is not None:
+        set_["last_scrape_inserted"] = case(
+            (
+                stats.last_scraped_at == stmt.excluded.last_scraped_at,
+                stats.last_scrape_inserted + stmt.excluded.last_scrape_inserted,
+            ),
+            else_=stmt.excluded.last_scrape_inserted,
+        )
+        set_["last_scraped_at"] = stmt.excluded.last_scraped_at
+    db.execute(stmt.on_conflict_do_update(index_elements=["user_id"], set_=set_))
+
+
+def deleted_totals(stmt):
+    """
+    Wrap an item DELETE so it returns one (count, bytes) row.
+
+    The DELETE runs as a data-modifying CTE, so the removed count and bytes
+    come back in one aggregate row, whatever the number of items.
+
+    Args:
+        stmt (Delete): DELETE on scraped_items.
+
+    Returns:
+        Select: SELECT of the deleted item count and description bytes.
+    """
+    deleted = stmt.returning(_description_bytes.label("bytes")).cte("deleted")
+    return select(
+        func.count(), func.coalesce(func.sum(deleted.c.bytes), literal_column("0"))
+    )
+
+
+def delete_items(db: Session, owner_id: UUID, stmt) -> int:
+    """
+    Execute a DELETE of a user's items and record it in their stats row.
+
+    Args:
+        db (Session): SQLAlchemy session holding the write transaction.
+        owner_id (UUID): ID of the user whose items are deleted.
+        stmt (Delete): DELETE on scraped_items restricted to ``owner_id``.
+
+    Returns:
+        int: Number of deleted items.
+    """
+    count, size = db.execute(deleted_totals(stmt)).one()
+    if count:
+        record_item_changes(db, owner_id, -count, -int(size))
+    return count
+
+
+def _actual_stats():
+    """Select (owner_id, item_count, description_bytes, newest item) per owner."""
+    return (
+        select(
+            ScrapedItem.owner_id.label("user_id"),
+            func.count().label("item_count"),
+            func.coalesce(func.sum(_description_bytes), 0).label("description_bytes"),
+            func.max(ScrapedItem.created_at).label("newest"),
+        )
+        .group_by(ScrapedItem.owner_id)
+        .subquery()
+    )
+
+
+def find_drift(db: Session) -> List[Tuple[UUID, int, int, int, int]]:
+    """
+    Compare every stats row with the items it summarizes.
+
+    Args:
+        db (Session): SQLAlchemy database session.
+
+    Returns:
+        list[tuple]: ``(user_id, stored_count, actual_count, stored_bytes,
+            actual_bytes)`` for each user whose row is missing or wrong.
+    """
+    actual = _actual_stats()
+    stored = UserItemStats.__table__
+    user_id = func.coalesce(actual.c.user_id, stored.c.user_id)
+    stored_count = func.coalesce(stored.c.item_count, 0)
+    actual_count = func.coalesce(actual.c.item_count, 0)
+    stored_bytes = func.coalesce(stored.c.description_bytes, 0)
+    actual_bytes = func.coalesce(actual.c.description_bytes, 0)
+    query = (
+        select(user_id, stored_count, actual_count, stored_bytes, actual_bytes)
+        .select_from(
+            actual.join(stored, actual.c.user_id == stored.c.user_id, full=True)
+        )
+        .where((stored_count != actual_count) | (stored_bytes != actual_bytes))
+    )
+    return [tuple(row) for row in db.execute(query)]
+
+
+def rebuild_item_stats(db: Session) -> int:
+    """
+    Recompute every user's counts from scraped_items and commit.
+
+    Item writes are blocked for the duration (SHARE lock on scraped_items)
+    so no ingest or delete can slip a delta between the recount and the
+    rewrite. Scrape times are kept; rows created here take the newest item's
+    creation time as ``last_scraped_at``.
+
+    Args:
+        db (Session): SQLAlchemy database session.
+
+    Returns:
+        int: Number of stats rows written.
+    """
+    db.execute(text("LOCK TABLE scraped_items IN SHARE MODE"))
+    actual = _actual_stats()
+    stmt = pg_insert(UserItemStats).from_select(
+        ["user_id", "item_count", "description_bytes", "last_scraped_at"],
+        select(
+            actual.c.user_id,
+            actual.c.item_count,
+            actual.c.description_bytes,
+            actual.c.newest,
+        ),
+    )
+    rewritten = db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["user_id"],
+            set_={
+                "item_count": stmt.excluded.item_count,
+                "description_bytes": stmt.excluded.description_bytes,
+                "last_scraped_at": func.coalesce(
+                    UserItemStats.__table__.c.last_scraped_at,
+                    stmt.excluded.last_scraped_at,
+                ),
+            },
+        )
+    ).rowcount
+    emptied = db.execute(
+        UserItemStats.__table__.update()
+        .where(
+            UserItemStats.user_id.not_in(select(actual.c.user_id)),
+            UserItemStats.item_count != 0,
+        )
+        .values(item_count=0, description_bytes=0)
+    ).rowcount
+    db.commit()
+    return rewritten + emptied
+
+
+def main() -> None:
+    from app.core.database import SessionLocal, get_engine
+
+    parser = argparse.ArgumentParser(description="Check or rebuild user_item_stats.")
+    parser.add_argument("--fix", action="store_true", help="rebuild rows that drifted")
+    args = parser.parse_args()
+
+    get_engine()
+    with SessionLocal() as db:
+        drift = find_drift(db)
+        names = dict(
+            db.execute(
+                select(User.id, User.username).where(User.id.in_([d[0] for d in drift]))
+            ).all()
+        )
+        for user_id, stored_count, actual_count, stored_bytes, actual_bytes in drift:
+            print(
+                f"{names.get(user_id, user_id)}: count {stored_count} != {actual_count} "
+                f"or bytes {stored_bytes} != {actual_bytes}"
+            )
+        print(f"{len(drift)} users drifted")
+        if drift and args.fix:
+            db.rollback()
+            print(f"rebuilt stats for {rebuild_item_stats(db)} users")
+        elif drift:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+"""
+Adaptive rate limiting and retry policy for the scraper.
+
+Implements an AIMD (additive-increase / multiplicative-decrease) limiter that
+speeds up while the upstream responds quickly and without errors, and backs off
+on throttling responses (429/503) or rising latency. Also provides helpers for
+parsing ``Retry-After`` headers and computing jittered exponential backoff.
+
+Classes:
+- ScrapeStats: Per-scrape counters for requests, retries and rate changes.
+- AdaptiveRateLimiter: AIMD limiter controlling the delay between requests.
+
+Functions:
+- parse_retry_after: Parse a Retry-After header into seconds.
+- backoff_delay: Full-jitter exponential backoff for a given attempt.
+"""
+
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+INITIAL_DELAY = float(os.getenv("SCRAPER_RATE_LIMIT_SECONDS", "0.7"))
+MIN_DELAY = float(os.getenv("SCRAPER_MIN_DELAY_SECONDS", "0.1"))
+MAX_DELAY = float(os.getenv("SCRAPER_MAX_DELAY_SECONDS", "10"))
+RATE_STEP = float(os.getenv("SCRAPER_RATE_STEP", "0.25"))
+BACKOFF_FACTOR = float(os.getenv("SCRAPER_BACKOFF_FACTOR", "0.5"))
+LATENCY_TARGET = float(os.getenv("SCRAPER_LATENCY_TARGET_SECONDS", "1.0"))
+MAX_RETRIES = int(os.getenv("SCRAPER_MAX_RETRIES", "3"))
+RETRY_BUDGET = int(os.getenv("SCRAPER_RETRY_BUDGET", "20"))
+BACKOFF_BASE = float(os.getenv("SCRAPER_BACKOFF_BASE_SECONDS", "0.5"))
+BACKOFF_CAP = float(os.getenv("SCRAPER_BACKOFF_CAP_SECONDS", "30"))
+
+THROTTLE_STATUSES = frozenset({429, 503})
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+@dataclass
+class ScrapeStats:
+    """
+    Counters collected during a single scrape run.
+
+    Attributes:
+        requests (int): Total HTTP requests issued, including retries.
+        retries (int): Number of retried requests.
+        throttled (int): Responses with a throttling status (429/503).
+        failures (int): Requests that failed after exhausting retries.
+        rate_increases (int): Additive rate increases applied by the limiter.
+        rate_decreases (int): Multiplicative rate decreases applied by the limiter.
+        final_rate (float): Requests per second at the end of the scrape.
+        status_counts (Dict[int, int]): Number of responses per status code.
+        lock (threading.Lock): Guards the counters when several threads
+            fetch for the same scrape (see scraper_service.fetch_covers).
+    """
+
+    requests: int = 0
+    retries: int = 0
+    throttled: int = 0
+    failures: int = 0
+    rate_increases: int = 0
+    rate_decreases: int = 0
+    final_rate: float = 0.0
+    status_counts: Dict[int, int] = field(default_factory=dict)
+    lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def record_status(self, status_code: int) -> None:
+        """Increment the counter for a response status code."""
+        with self.lock:
+            self.status_counts[status_code] = self.status_counts.get(status_code, 0) + 1
+
+    def as_dict(self) -> dict:
+        """Return the stats as a JSON-serializable dict."""
+        with self.lock:
+            data = {
+                f.name: getattr(self, f.name) for f in fields(self) if f.name != "lock"
+            }
+            data["status_counts"] = {str(k): v for k, v in self.status_counts.items()}
+        data["final_rate"] = round(self.final_rate, 3)
+        return data
+
+
+class AdaptiveRateLimiter:
+    """
+    AIMD limiter controlling the delay between consecutive upstream requests.
+
+    The rate (requests per second) grows by a fixed step after each fast,
+    successful response and is multiplied by a backoff factor on throttling
+    or when latency exceeds the target. The rate is clamped to the range
+    implied by the minimum and maximum delays.
+
+    The limiter is thread-safe: concurrent workers sharing it are handed
+    successive request slots, so together they stay within one rate budget.
+
+    Args:
+        initial_delay (float): Starting delay between requests in seconds.
+        min_delay (float): Smallest delay allowed (caps the maximum rate).
+        max_delay (float): Largest delay allowed (floors the minimum rate).
+        step (float): Additive rate increase in requests per second.
+        factor (float): Multiplicative rate decrease, between 0 and 1.
+        latency_target (float): Latency in seconds above which the limiter backs off.
+        stats (ScrapeStats | None): Optional stats object to update.
+    """
+
+    def __init__(
+        self,
+        initial_delay: float = INITIAL_DELAY,
+        min_delay: float = MIN_DELAY,
+        max_delay: float = MAX_DELAY,
+        step: float = RATE_STEP,
+        factor: float = BACKOFF_FACTOR,
+        latency_target: float = LATENCY_TARGET,
+        stats: Optional[ScrapeStats] = None,
+    ):
+        self.min_rate = 1.0 / max_delay
+        self.max_rate = 1.0 / min_delay if min_delay > 0 else float("inf")
+        self.rate = self._clamp(1.0 / initial_delay if initial_delay > 0 else self.max_rate)
+        self.step = step
+        self.factor = factor
+        self.latency_target = latency_target
+        self.stats = stats if stats is not None else ScrapeStats()
+        self.stats.final_rate = self.rate
+        self._next_allowed = 0.0
+        self._lock = threading.Lock()
+
+    def _clamp(self, rate: float) -> float:
+        return max(self.min_rate, min(self.max_rate, rate))
+
+    @property
+    def delay(self) -> float:
+        """Current delay between requests in seconds."""
+        return 1.0 / self.rate
+
+    def wait(self) -> None:
+        """Block until the next request is allowed by the current rate or pause."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_allowed)
+            self._next_allowed = slot + self.delay
+        if slot > now:
+            time.sleep(slot - now)
+
+    def pause(self, seconds: float) -> None:
+        """Push back the next allowed request by at least ``seconds``."""
+        with self._lock:
+            self._next_allowed = max(self._next_allowed, time.monotonic() + seconds)
+
+    def on_response(self, status_code: int, latency: float) -> None:
+        """
+        Adjust the rate after a response.
+
+        Args:
+            status_code (int): HTTP status code of the response.
+            latency (float): Time taken by the request in seconds.
+        """
+        if status_code in THROTTLE_STATUSES or latency > self.latency_target:
+            self._decrease()
+        elif status_code < 400:
+            self._increase()
+
+    def on_error(self) -> None:
+        """Back off after a connection error or timeout."""
+        self._decrease()
+
+    def _increase(self) -> None:
+        with self._lock:
+            new_rate = self._clamp(self.rate + self.step)
+            if new_rate > self.rate:
+                self.stats.rate_increases += 1
+            self.rate = new_rate
+            self.stats.final_rate = self.rate
+
+    def _decrease(self) -> None:
+        with self._lock:
+            new_rate = self._clamp(self.rate * self.factor)
+            if new_rate < self.rate:
+                self.stats.rate_decreases += 1
+            self.rate = new_rate
+            self.stats.final_rate = self.rate
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value (str | None): Header value, either delta-seconds or an HTTP-date.
+
+    Returns:
+        float | None: Seconds to wait, or None if missing or unparseable.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def backoff_delay(
+    attempt: int, base: float = BACKOFF_BASE, cap: float = BACKOFF_CAP
+) -> float:
+    """
+    Compute a full-jitter exponential backoff delay.
+
+    Args:
+        attempt (int): Zero-based retry attempt number.
+        base (float): Base delay in seconds.
+        cap (float): Maximum delay in seconds.
+
+    Returns:
+        float: Random delay between 0 and ``min(cap, base * 2**attempt)``.
+    """
+    return random.uniform(0, min(cap, base * (2**attempt)))
@@ -2,15 +2,32 @@
 Web scraper service for books.toscrape.com.
 
 Implements polite scraping with respect to robots.txt,
-rate limiting, request timeout, and user agent configuration.
+adaptive rate limiting with retries, request timeout, and user agent configuration.
+
+Response bodies are streamed in chunks under a size cap, and product pages
+are parsed incrementally as chunks arrive, so peak memory per fetch is
+bounded by the chunk size rather than the page size.
+
+Classes:
+- ScrapeProgress: Pages done, rate and ETA of a running scrape.
 
 Functions:
 - scrape_books: Scrapes the first page of books, returning a list of book items.
+- iter_books: Same scrape, yielding book items as they are parsed.
+- fetch_covers: Downloads cover images concurrently into the asset store.
+- fetch_product: Streams a product page and extracts its book item.
+- parse_product: Extracts a book item from product page markup.
+- reparse_archive: Rebuilds book items from archived pages without network I/O.
 """
 
+import codecs
 import os
+import re
 import time
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from decimal import Decimal, InvalidOperation
+from html.parser import HTMLParser
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
 from urllib import robotparser
 from urllib.parse import urljoin
 
@@ -18,26 +35,264 @@ import logging
 import requests
 from bs4 import BeautifulSoup
 
+from app.core.http_client import HttpClient, get_http_client
+from app.services.archive import PageArchive, get_archive
+from app.services.assets import (
+    ASSET_WORKERS,
+    THUMBNAIL_WORKERS,
+    AssetStore,
+    get_asset_store,
+)
+from app.services.rate_limiter import (
+    AdaptiveRateLimiter,
+    ScrapeStats,
+    BACKOFF_CAP,
+    RETRYABLE_STATUSES,
+    MAX_RETRIES,
+    RETRY_BUDGET,
+    backoff_delay,
+    parse_retry_after,
+)
+
 USER_AGENT = os.getenv("SCRAPER_USER_AGENT", "WebScraper/1.0")
-RATE_LIMIT = float(os.getenv("SCRAPER_RATE_LIMIT_SECONDS", "0.7"))
 REQ_TIMEOUT = float(os.getenv("SCRAPER_REQUEST_TIMEOUT", "10"))
 RESPECT_ROBOTS = os.getenv("SCRAPER_RESPECT_ROBOTS", "1") == "1"
+MAX_BODY_BYTES = int(os.getenv("SCRAPER_MAX_BODY_BYTES", str(5 * 1024 * 1024)))
+CHUNK_SIZE = int(os.getenv("SCRAPER_CHUNK_SIZE", "16384"))
 
 BASE_URL = "https://books.toscrape.com/"
 
 logger = logging.getLogger(__name__)
 
 
-def _get_session() -> requests.Session:
+class ResponseTooLarge(requests.RequestException):
+    """Raised when a response body exceeds SCRAPER_MAX_BODY_BYTES."""
+
+
+class BookItem:
+    """
+    Compact record for a scraped book.
+
+    Attributes:
+        title (str): Book title.
+        description (str | None): Product description, if present.
+        url (str): Product page URL.
+        price (Decimal | None): Price shown on the product page.
+        stock (int | None): Number of copies available.
+        rating (int | None): Star rating from 1 to 5.
+        upc (str | None): Universal Product Code.
+        category (str | None): Category from the breadcrumb.
+        image_url (str | None): Absolute URL of the cover image.
+        cover_sha256 (str | None): Hash of the downloaded cover in the asset store.
     """
-    Create and configure a requests.Session with the User-Agent header.
 
-    Returns:
-        requests.Session: Configured HTTP session.
+    __slots__ = (
+        "title",
+        "description",
+        "url",
+        "price",
+        "stock",
+        "rating",
+        "upc",
+        "category",
+        "image_url",
+        "cover_sha256",
+    )
+
+    def __init__(
+        self,
+        title: str,
+        description: Optional[str],
+        url: str,
+        price: Optional[Decimal] = None,
+        stock: Optional[int] = None,
+        rating: Optional[int] = None,
+        upc: Optional[str] = None,
+        category: Optional[str] = None,
+        image_url: Optional[str] = None,
+        cover_sha256: Optional[str] = None,
+    ):
+        self.title = title
+        self.description = description
+        self.url = url
+        self.price = price
+        self.stock = stock
+        self.rating = rating
+        self.upc = upc
+        self.category = category
+        self.image_url = image_url
+        self.cover_sha256 = cover_sha256
+
+    def __repr__(self) -> str:
+        return f"BookItem(title={self.title!r}, url={self.url!r})"
+
+
+_RATINGS = {"One": 1, "Two": 2, "Three": 3, "Four": 4, "Five": 5}
+_PRICE_RE = re.compile(r"\d[\d,]*(?:\.\d+)?")
+_STOCK_RE = re.compile(r"\((\d+) available\)")
+
+
+def _parse_price(text: Optional[str]) -> Optional[Decimal]:
+    """Parse a price such as '£51.77' into a Decimal."""
+    match = _PRICE_RE.search(text or "")
+    if not match:
+        return None
+    try:
+        return Decimal(match.group(0).replace(",", ""))
+    except InvalidOperation:
+        return None
+
+
+def _parse_stock(text: Optional[str]) -> Optional[int]:
+    """Parse availability such as 'In stock (22 available)' into a count."""
+    if not text:
+        return None
+    match = _STOCK_RE.search(text)
+    if match:
+        return int(match.group(1))
+    return 0 if "out of stock" in text.lower() else None
+
+
+class _ProductParser(HTMLParser):
+    """
+    Feed-based extractor for the fields of a product page.
+
+    Mirrors the selectors ``.product_main h1``, ``.product_main .price_color``,
+    ``.product_main .star-rating``, ``#product_description ~ p``, the
+    ``ul.breadcrumb`` links, the first ``#product_gallery img`` and the
+    product information table. Text pieces
+    are stripped and joined like BeautifulSoup's ``get_text(strip=True)``.
+    ``done`` becomes True once the title is known and the information table
+    (the last of these sections on the page) has been read, after which
+    further input can be skipped.
     """
-    s = requests.Session()
-    s.headers.update({"User-Agent": USER_AGENT})
-    return s
+
+    def __init__(self):
+        super().__init__()
+        self._in_main = False
+        self._in_breadcrumb = False
+        self._in_gallery = False
+        self._in_table = False
+        self._table_done = False
+        self._after_desc_header = False
+        self._capture: Optional[List[str]] = None
+        self._capture_key: Optional[str] = None
+        self._capture_tag: Optional[str] = None
+        self._node: List[str] = []
+        self._row_key: Optional[str] = None
+        self._crumbs: List[str] = []
+        self.title: Optional[str] = None
+        self.description: Optional[str] = None
+        self.price_text: Optional[str] = None
+        self.rating: Optional[int] = None
+        self.image_src: Optional[str] = None
+        self.table: dict = {}
+
+    @property
+    def done(self) -> bool:
+        return self.title is not None and self._table_done
+
+    @property
+    def category(self) -> Optional[str]:
+        # Breadcrumb links are Home > Books > <category>.
+        return self._crumbs[2] if len(self._crumbs) > 2 else None
+
+    def item(self, url: str) -> Optional[BookItem]:
+        """Build a BookItem from the parsed fields, or None without a title."""
+        if not self.title:
+            return None
+        return BookItem(
+            self.title,
+            self.description,
+            url,
+            price=_parse_price(self.price_text),
+            stock=_parse_stock(self.table.get("Availability")),
+            rating=self.rating,
+            upc=self.table.get("UPC"),
+            category=self.category,
+            image_url=urljoin(url, self.image_src) if self.image_src else None,
+        )
+
+    def _start(self, key: str, tag: str) -> None:
+        self._capture, self._capture_key, self._capture_tag = [], key, tag
+
+    def _flush_node(self) -> None:
+        """Close the pending text node; feeds may split one node across calls."""
+        if self._node:
+            self._capture.append("".join(self._node).strip())
+            self._node = []
+
+    def handle_starttag(self, tag, attrs):
+        if self._capture is not None:
+            self._flush_node()
+            return
+        attrs = dict(attrs)
+        classes = (attrs.get("class") or "").split()
+        if tag == "ul" and "breadcrumb" in classes:
+            self._in_breadcrumb = True
+        elif tag == "a" and self._in_breadcrumb:
+            self._start("crumb", "a")
+        elif attrs.get("id") == "product_gallery":
+            self._in_gallery = self.image_src is None
+        elif tag == "img" and self._in_gallery and attrs.get("src"):
+            self.image_src = attrs["src"]
+            self._in_gallery = False
+        elif "product_main" in classes:
+            self._in_main = True
+        elif tag == "h1" and self._in_main and self.title is None:
+            self._start("title", "h1")
+        elif tag == "p" and self._in_main and "price_color" in classes and self.price_text is None:
+            self._start("price", "p")
+        elif tag == "p" and self._in_main and "star-rating" in classes and self.rating is None:
+            self.rating = next((_RATINGS[c] for c in classes if c in _RATINGS), None)
+        elif attrs.get("id") == "product_description":
+            self._after_desc_header = True
+        elif tag == "p" and self._after_desc_header and self.description is None:
+            self._start("description", "p")
+        elif tag == "table" and "table-striped" in classes and not self._table_done:
+            self._in_table = True
+        elif tag in ("th", "td") and self._in_table:
+            self._start(tag, tag)
+
+    def handle_endtag(self, tag):
+        if self._capture is None:
+            if tag == "ul" and self._in_breadcrumb:
+                self._in_breadcrumb = False
+            elif tag == "table" and self._in_table:
+                self._in_table = False
+                self._table_done = True
+            return
+        self._flush_node()
+        if tag != self._capture_tag:
+            return
+        text = "".join(self._capture)
+        key = self._capture_key
+        self._capture = self._capture_key = self._capture_tag = None
+        if key == "title":
+            self.title = text
+        elif key == "price":
+            self.price_text = text
+        elif key == "description":
+            self.description = text
+            self._after_desc_header = False
+        elif key == "crumb":
+            self._crumbs.append(text)
+        elif key == "th":
+            self._row_key = text
+        elif key == "td" and self._row_key:
+            self.table[self._row_key] = text
+            self._row_key = None
+
+    def handle_data(self, data):
+        if self._capture is not None:
+            self._node.append(data)
+
+
+def _body_encoding(response: requests.Response) -> str:
+    """Return the declared charset of a response, defaulting to UTF-8."""
+    if "charset" in response.headers.get("Content-Type", "").lower() and response.encoding:
+        return response.encoding
+    return "utf-8"
 
 
 def _load_robots(base_url: str) -> robotparser.RobotFileParser:
@@ -80,26 +335,197 @@ def _can_fetch(rp: robotparser.RobotFileParser, url: str) -> bool:
         return True
 
 
-def scrape_books() -> List[Dict[str, Optional[str]]]:
+def _fetch(
+    client: HttpClient, url: str, limiter: AdaptiveRateLimiter
+) -> requests.Response:
     """
-    Scrape the first page of books.toscrape.com.
+    GET a URL through the rate limiter, retrying transient failures.
+
+    Retries connection errors, timeouts and retryable status codes
+    (429, 5xx) with jittered exponential backoff, honoring Retry-After
+    when the upstream sends it. Retries are bounded both per request
+    (SCRAPER_MAX_RETRIES) and per scrape (SCRAPER_RETRY_BUDGET). A
+    Retry-After longer than SCRAPER_BACKOFF_CAP_SECONDS fails the request
+    at once and still uses up one retry from the budget.
+
+    Args:
+        client (HttpClient): Shared HTTP client to use.
+        url (str): URL to fetch.
+        limiter (AdaptiveRateLimiter): Limiter pacing the requests.
 
-    For each book, scrape the title, description, and URL,
-    respecting robots.txt and rate limits.
+    The response is opened in streaming mode and its body is left unread;
+    pass it to _read_body to consume it.
 
     Returns:
-        List[Dict[str, Optional[str]]]: List of book items with keys: title, description, url.
+        requests.Response: Successful response with an unread body.
+
+    Raises:
+        requests.RequestException: If the request still fails after retries.
     """
-    list_url = urljoin(BASE_URL, "catalogue/page-1.html")
+    stats = limiter.stats
+    attempt = 0
+    while True:
+        limiter.wait()
+        with stats.lock:
+            stats.requests += 1
+        logger.info("GET %s", url)
+        start = time.perf_counter()
+        try:
+            r = client.get(url, timeout=REQ_TIMEOUT, stream=True)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            limiter.on_error()
+            error: requests.RequestException = e
+            retry_after = None
+        else:
+            latency = time.perf_counter() - start
+            stats.record_status(r.status_code)
+            limiter.on_response(r.status_code, latency)
+            if r.status_code not in RETRYABLE_STATUSES:
+                if r.status_code >= 400:
+                    r.close()
+                r.raise_for_status()
+                return r
+            r.close()
+            if r.status_code in (429, 503):
+                with stats.lock:
+                    stats.throttled += 1
+            error = requests.HTTPError(
+                f"{r.status_code} Error for url: {url}", response=r
+            )
+            retry_after = parse_retry_after(r.headers.get("Retry-After"))
+
+        # Check and take the retry under the lock: cover downloads share the
+        # budget across threads.
+        too_long = retry_after is not None and retry_after > BACKOFF_CAP
+        with stats.lock:
+            exhausted = attempt >= MAX_RETRIES or stats.retries >= RETRY_BUDGET
+            if not exhausted:
+                # A Retry-After too long to wait out still uses up its retry.
+                stats.retries += 1
+            if exhausted or too_long:
+                stats.failures += 1
+        if exhausted:
+            raise error
+        if too_long:
+            # Waiting that long would stall the whole scrape.
+            logger.warning(
+                "Not retrying %s: Retry-After %.0fs exceeds %.0fs",
+                url,
+                retry_after,
+                BACKOFF_CAP,
+            )
+            raise error
 
-    session = _get_session()
-    rp = _load_robots(BASE_URL)
+        delay = backoff_delay(attempt)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        logger.info("Retrying %s in %.2fs (attempt %s): %s", url, delay, attempt + 1, error)
+        limiter.pause(delay)
+        attempt += 1
+
+
+def _read_body(
+    client: HttpClient,
+    response: requests.Response,
+    on_chunk: Callable[[bytes], None],
+) -> int:
+    """
+    Stream a response body in chunks, enforcing the size cap.
 
-    logger.info("GET %s", list_url)
-    r = session.get(list_url, timeout=REQ_TIMEOUT)
-    r.raise_for_status()
+    Args:
+        client (HttpClient): Client whose transfer metrics are updated.
+        response (requests.Response): Streamed response with an unread body.
+        on_chunk (Callable[[bytes], None]): Called with each decoded chunk.
+
+    Returns:
+        int: Number of body bytes read.
+
+    Raises:
+        ResponseTooLarge: If the body exceeds SCRAPER_MAX_BODY_BYTES; the
+            transfer is aborted as soon as the cap is crossed.
+    """
+    total = 0
+    wire = 0
+    try:
+        declared = response.headers.get("Content-Length")
+        if declared and declared.isdigit() and int(declared) > MAX_BODY_BYTES:
+            raise ResponseTooLarge(
+                f"Body of {response.url} declares {declared} bytes (cap {MAX_BODY_BYTES})"
+            )
+        for chunk in response.iter_content(CHUNK_SIZE):
+            total += len(chunk)
+            if total > MAX_BODY_BYTES:
+                raise ResponseTooLarge(
+                    f"Body of {response.url} exceeded {MAX_BODY_BYTES} bytes"
+                )
+            on_chunk(chunk)
+        try:
+            wire = response.raw.tell()
+        except Exception:
+            wire = total
+    finally:
+        response.close()
+    client.record(wire or total, total)
+    return total
+
+
+def fetch_product(
+    client: HttpClient,
+    url: str,
+    limiter: AdaptiveRateLimiter,
+    archive: Optional[PageArchive] = None,
+) -> Optional[BookItem]:
+    """
+    Fetch a product page and extract its book item while streaming.
 
-    soup = BeautifulSoup(r.text, "html.parser")
+    Chunks are decoded and fed to the incremental parser as they arrive;
+    once the product fields are found the remaining chunks are
+    drained without parsing (keeping the connection reusable). The raw
+    body is buffered only when it must be archived.
+
+    Args:
+        client (HttpClient): Shared HTTP client to use.
+        url (str): Product page URL.
+        limiter (AdaptiveRateLimiter): Limiter pacing the requests.
+        archive (PageArchive | None): Archive to store the raw body in.
+
+    Returns:
+        BookItem | None: Extracted item, or None if the page has no title.
+
+    Raises:
+        requests.RequestException: If the fetch fails or the body is too large.
+    """
+    response = _fetch(client, url, limiter)
+    parser = _ProductParser()
+    decoder = codecs.getincrementaldecoder(_body_encoding(response))(errors="replace")
+    raw: Optional[bytearray] = bytearray() if archive is not None else None
+
+    def on_chunk(chunk: bytes) -> None:
+        if raw is not None:
+            raw.extend(chunk)
+        if not parser.done:
+            parser.feed(decoder.decode(chunk))
+
+    _read_body(client, response, on_chunk)
+    if not parser.done:
+        parser.feed(decoder.decode(b"", final=True))
+        parser.close()
+    if raw is not None:
+        archive.put(url, bytes(raw))
+    return parser.item(url)
+
+
+def _parse_product_links(html) -> List[str]:
+    """
+    Extract absolute product page URLs from a listing page.
+
+    Args:
+        html (str | bytes): Listing page markup.
+
+    Returns:
+        List[str]: Product page URLs.
+    """
+    soup = BeautifulSoup(html, "html.parser")
 
     raw_links = [
         a.get("href", "")
@@ -110,47 +536,261 @@ def scrape_books() -> List[Dict[str, Optional[str]]]:
     for href in raw_links:
         if href.startswith("../../../"):
             href = href.replace("../../../", "catalogue/")
-        product_links.append(urljoin(BASE_URL, href))
-
-    items: List[Dict[str, Optional[str]]] = []
-    skipped = 0
-
-    for product_url in product_links:
+        product_url = urljoin(BASE_URL, href)
         if "/catalogue/" not in product_url:
             product_url = urljoin(
                 BASE_URL, "catalogue/" + product_url.split("/")[-2] + "/index.html"
             )
+        product_links.append(product_url)
+    return product_links
+
+
+def parse_product(html, url: str) -> Optional[BookItem]:
+    """
+    Extract a book item from a product page.
 
+    Args:
+        html (str | bytes): Product page markup; bytes are decoded as UTF-8.
+        url (str): URL of the product page.
+
+    Returns:
+        BookItem | None: Extracted item, or None if the page has no title.
+    """
+    if isinstance(html, bytes):
+        html = html.decode("utf-8", errors="replace")
+    parser = _ProductParser()
+    parser.feed(html)
+    parser.close()
+    return parser.item(url)
+
+
+class ScrapeProgress:
+    """
+    Page-level progress of a running scrape.
+
+    Attributes:
+        pages_total (int): Product pages to visit (known after the listing).
+        pages_done (int): Product pages visited so far, including skipped ones.
+        items (int): Items parsed so far.
+        skipped (int): Pages skipped (robots.txt, request failure, no title).
+        started (float): time.monotonic() when the scrape started.
+    """
+
+    __slots__ = ("pages_total", "pages_done", "items", "skipped", "started")
+
+    def __init__(self):
+        self.pages_total = 0
+        self.pages_done = 0
+        self.items = 0
+        self.skipped = 0
+        self.started = time.monotonic()
+
+    def as_dict(self) -> dict:
+        """Return progress with the page rate and an ETA for the remaining pages."""
+        elapsed = time.monotonic() - self.started
+        rate = self.pages_done / elapsed if elapsed > 0 else 0.0
+        remaining = self.pages_total - self.pages_done
+        return {
+            "pages_total": self.pages_total,
+            "pages_done": self.pages_done,
+            "items": self.items,
+            "skipped": self.skipped,
+            "elapsed_seconds": round(elapsed, 2),
+            "pages_per_second": round(rate, 3),
+            "eta_seconds": round(remaining / rate, 1) if rate else None,
+        }
+
+
+def iter_books(
+    stats: Optional[ScrapeStats] = None,
+    progress: Optional[ScrapeProgress] = None,
+    limiter: Optional[AdaptiveRateLimiter] = None,
+) -> Iterator[BookItem]:
+    """
+    Scrape the first page of books.toscrape.com, yielding books as they are parsed.
+
+    For each book, scrape the title, description, URL, price, stock,
+    rating, UPC and category,
+    respecting robots.txt and the adaptive rate limiter. When the page
+    archive is enabled, every fetched body is archived for offline re-parsing.
+
+    Args:
+        stats (ScrapeStats | None): Optional stats object filled with
+            request, retry and rate counters for this scrape.
+        progress (ScrapeProgress | None): Optional progress object updated
+            after the listing and after every product page.
+        limiter (AdaptiveRateLimiter | None): Limiter to pace requests with,
+            e.g. to share its budget with the cover downloads; a new one
+            reporting into ``stats`` is created if omitted.
+
+    Yields:
+        BookItem: Scraped book items, one per product page fetched.
+
+    Raises:
+        requests.RequestException: If the listing page cannot be fetched.
+    """
+    list_url = urljoin(BASE_URL, "catalogue/page-1.html")
+    progress = progress or ScrapeProgress()
+
+    client = get_http_client()
+    archive = get_archive()
+    rp = _load_robots(BASE_URL)
+    limiter = limiter or AdaptiveRateLimiter(stats=stats)
+
+    r = _fetch(client, list_url, limiter)
+    listing = bytearray()
+    _read_body(client, r, listing.extend)
+    if archive is not None:
+        archive.put(list_url, bytes(listing))
+
+    product_links = _parse_product_links(
+        listing.decode(_body_encoding(r), errors="replace")
+    )
+    del listing
+    progress.pages_total = len(product_links)
+
+    for product_url in product_links:
+        progress.pages_done += 1
         if not _can_fetch(rp, product_url):
             logger.info("robots.txt disallows product fetch: %s", product_url)
-            skipped += 1
+            progress.skipped += 1
             continue
 
-        time.sleep(RATE_LIMIT)
-
         try:
-            logger.info("GET %s", product_url)
-            pr = session.get(product_url, timeout=REQ_TIMEOUT)
-            pr.raise_for_status()
+            item = fetch_product(client, product_url, limiter, archive)
         except requests.RequestException as e:
             logger.warning("Request failed for %s: %s", product_url, e)
-            skipped += 1
+            progress.skipped += 1
             continue
 
-        psoup = BeautifulSoup(pr.text, "html.parser")
+        if item is None:
+            logger.warning("Missing title for %s — skipping.", product_url)
+            progress.skipped += 1
+            continue
 
-        title_tag = psoup.select_one(".product_main h1")
-        title = title_tag.get_text(strip=True) if title_tag else None
+        progress.items += 1
+        yield item
+
+    logger.info(
+        "Scrape finished: gathered=%s, skipped=%s, requests=%s, retries=%s, rate=%.2f/s",
+        progress.items,
+        progress.skipped,
+        limiter.stats.requests,
+        limiter.stats.retries,
+        limiter.rate,
+    )
+
+
+def fetch_covers(
+    items: Iterable[BookItem],
+    client: HttpClient,
+    limiter: AdaptiveRateLimiter,
+    store: AssetStore,
+) -> int:
+    """
+    Download the cover images of items into the asset store.
 
-        desc_tag = psoup.select_one("#product_description ~ p")
-        description = desc_tag.get_text(strip=True) if desc_tag else None
+    Covers whose URL the store already knows (from any user's scrape) are
+    not fetched again. The rest are downloaded by SCRAPER_ASSET_WORKERS
+    threads sharing the scrape's limiter, so the extra requests stay within
+    its rate budget, and thumbnails are generated in a separate pool of
+    SCRAPER_THUMBNAIL_WORKERS as downloads complete. Each item's
+    ``cover_sha256`` is set when its cover is available.
 
-        if not title:
-            logger.warning("Missing title for %s — skipping.", product_url)
-            skipped += 1
+    Args:
+        items (Iterable[BookItem]): Items whose covers to fetch.
+        client (HttpClient): Shared HTTP client to use.
+        limiter (AdaptiveRateLimiter): Limiter pacing the scrape.
+        store (AssetStore): Store receiving the images.
+
+    Returns:
+        int: Number of images downloaded.
+    """
+    pending: Dict[str, List[BookItem]] = {}
+    for item in items:
+        if not item.image_url:
             continue
+        digest = store.lookup(item.image_url)
+        if digest:
+            item.cover_sha256 = digest
+        else:
+            pending.setdefault(item.image_url, []).append(item)
+    if not pending:
+        return 0
+
+    def download(url: str) -> str:
+        body = bytearray()
+        _read_body(client, _fetch(client, url, limiter), body.extend)
+        return store.put(url, bytes(body))
+
+    downloaded = 0
+    with ThreadPoolExecutor(ASSET_WORKERS) as downloads, ThreadPoolExecutor(
+        THUMBNAIL_WORKERS
+    ) as thumbnails:
+        futures = {downloads.submit(download, url): url for url in pending}
+        for future in as_completed(futures):
+            url = futures[future]
+            try:
+                digest = future.result()
+            except requests.RequestException as e:
+                logger.warning("Cover download failed for %s: %s", url, e)
+                continue
+            downloaded += 1
+            for item in pending[url]:
+                item.cover_sha256 = digest
+            thumbnails.submit(store.make_thumbnail, digest)
+    return downloaded
+
+
+def scrape_books(stats: Optional[ScrapeStats] = None) -> List[BookItem]:
+    """
+    Scrape the first page of books.toscrape.com.
+
+    Collects everything iter_books yields, then downloads the covers when
+    the asset store is enabled.
 
-        items.append({"title": title, "description": description, "url": product_url})
+    Args:
+        stats (ScrapeStats | None): Optional stats object filled with
+            request, retry and rate counters for this scrape.
 
-    logger.info("Scrape finished: gathered=%s, skipped=%s", len(items), skipped)
+    Returns:
+        List[BookItem]: Scraped book items.
+    """
+    limiter = AdaptiveRateLimiter(stats=stats)
+    items = list(iter_books(stats=stats, limiter=limiter))
+    store = get_asset_store()
+    if store is not None:
+        fetch_covers(items, get_http_client(), limiter, store)
     return items
+
+
+def reparse_archive(archive: PageArchive) -> Iterator[BookItem]:
+    """
+    Rebuild book items from archived product pages without network I/O.
+
+    Listing pages are skipped; every other archived page is run through
+    the current product selectors.
+
+    Args:
+        archive (PageArchive): Archive to read pages from.
+
+    Yields:
+        BookItem: Re-parsed book items.
+    """
+    parsed = skipped = 0
+    for url, digest in archive.entries():
+        if not url.endswith("/index.html"):
+            continue
+        try:
+            body = archive.get(digest)
+        except FileNotFoundError:
+            logger.warning("Archived object missing for %s — skipping.", url)
+            skipped += 1
+            continue
+        item = parse_product(body, url)
+        if item is None:
+            skipped += 1
+            continue
+        parsed += 1
+        yield item
+    logger.info("Archive re-parse finished: parsed=%s, skipped=%s", parsed, skipped)
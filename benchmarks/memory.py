@@ -0,0 +1,121 @@
+"""
+Peak-memory benchmark for product page fetching under concurrent crawls.
+
+Serves synthetic product pages from a local HTTP server and crawls them
+from several threads, comparing:
+- buffered: the previous approach (``r.text`` + BeautifulSoup tree);
+- streamed: fetch_product (chunked reads, size cap, incremental parser).
+
+Each mode runs in its own interpreter so peak RSS is measured independently.
+
+Usage:
+    python -m benchmarks.memory [--workers 16] [--pages 50] [--page-kb 2048]
+"""
+
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PAGE_HEAD = (
+    '<html><body><div class="col-sm-6 product_main"><h1>Benchmark Book</h1>'
+    '<p class="price_color">£10.00</p></div>'
+    '<div id="product_description" class="sub-header"><h2>Product Description</h2></div>'
+    "<p>A book used to measure scraper memory.</p>"
+)
+
+
+def _make_handler(body: bytes):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def _peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_mode(mode: str, workers: int, pages: int, page_kb: int) -> None:
+    """Crawl the local server with one strategy and print peak RSS."""
+    padding = "<div>" + "x" * 1000 + "</div>"
+    body = (PAGE_HEAD + padding * page_kb + "</body></html>").encode()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(body))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/catalogue/book_1/index.html"
+
+    from app.core.http_client import HttpClient
+    from app.services.rate_limiter import AdaptiveRateLimiter
+    from app.services import scraper_service
+
+    client = HttpClient(pool_maxsize=workers)
+
+    def buffered(_):
+        from bs4 import BeautifulSoup
+
+        r = client.get(url, timeout=30)
+        soup = BeautifulSoup(r.text, "html.parser")
+        return soup.select_one(".product_main h1").get_text(strip=True)
+
+    def streamed(_):
+        limiter = AdaptiveRateLimiter(initial_delay=0.001, min_delay=0.001)
+        return scraper_service.fetch_product(client, url, limiter).title
+
+    baseline = _peak_rss_mb()
+    fn = buffered if mode == "buffered" else streamed
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        titles = list(pool.map(fn, range(pages)))
+    server.shutdown()
+
+    assert all(t == "Benchmark Book" for t in titles)
+    peak = _peak_rss_mb()
+    print(
+        f"{mode:>8}: peak RSS {peak:.1f} MB (+{peak - baseline:.1f} MB over baseline) "
+        f"workers={workers} pages={pages} page={page_kb} KB"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--pages", type=int, default=50)
+    parser.add_argument("--page-kb", type=int, default=2048)
+    parser.add_argument("--mode", choices=["buffered", "streamed"])
+    args = parser.parse_args()
+
+    if args.mode:
+        run_mode(args.mode, args.workers, args.pages, args.page_kb)
+        return
+
+    env = {**os.environ, "SCRAPER_MAX_BODY_BYTES": str((args.page_kb + 64) * 1024)}
+    for mode in ("buffered", "streamed"):
+        subprocess.run(
+            [
+                sys.executable, "-m", "benchmarks.memory",
+                "--mode", mode,
+                "--workers", str(args.workers),
+                "--pages", str(args.pages),
+                "--page-kb", str(args.page_kb),
+            ],
+            cwd=ROOT,
+            env=env,
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+"""
+Query-plan benchmark for the item routes on a large dataset.
+
+For a sample of seeded users (see benchmarks.seed) it runs
+``EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)`` on the statements issued by
+list_items, get_item_stats, get_item, batch_get_items, delete_item and
+ingest_items, and
+reports median / p95 execution time, shared buffers touched and the plan
+shape. Writes (delete, ingest) are explained inside a transaction that is
+rolled back, so the dataset is left untouched.
+
+Run it before and after an index change and compare the two result files
+(the README's Benchmarks section has the full procedure):
+
+    python -m benchmarks.queries --output before.json
+    # apply the index change, then ANALYZE scraped_items
+    python -m benchmarks.queries --output after.json
+    python -m benchmarks.queries --compare before.json after.json
+
+Usage:
+    python -m benchmarks.queries [--samples 50] [--prefix bench-] [--output FILE]
+"""
+
+import argparse
+import json
+import random
+import statistics
+import uuid
+from typing import Callable, Dict, List
+
+from sqlalchemy import delete, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.core.database import get_engine
+from app.database.models import ScrapedItem, User, UserItemStats
+from app.services.item_stats import deleted_totals
+
+PAGE = 50
+
+
+# Each scenario builds the statement a route issues for one owner; they
+# mirror the queries in app.routes.book_scraper and app.services.ingest.
+SCENARIOS: Dict[str, Callable] = {
+    "list_items": lambda owner, ids: select(ScrapedItem)
+    .where(ScrapedItem.owner_id == owner)
+    .order_by(ScrapedItem.created_at, ScrapedItem.id)
+    .limit(PAGE),
+    "list_items_offset_500": lambda owner, ids: select(ScrapedItem)
+    .where(ScrapedItem.owner_id == owner)
+    .order_by(ScrapedItem.created_at, ScrapedItem.id)
+    .offset(500)
+    .limit(PAGE),
+    "list_items_newest": lambda owner, ids: select(ScrapedItem)
+    .where(ScrapedItem.owner_id == owner)
+    .order_by(ScrapedItem.created_at.desc(), ScrapedItem.id)
+    .limit(PAGE),
+    "list_items_price_filter": lambda owner, ids: select(ScrapedItem)
+    .where(
+        ScrapedItem.owner_id == owner,
+        ScrapedItem.price >= 20,
+        ScrapedItem.price <= 30,
+    )
+    .order_by(ScrapedItem.price.desc(), ScrapedItem.id)
+    .limit(PAGE),
+    "list_items_category": lambda owner, ids: select(ScrapedItem)
+    .where(ScrapedItem.owner_id == owner, ScrapedItem.category == "Category 7")
+    .order_by(ScrapedItem.price, ScrapedItem.id)
+    .limit(PAGE),
+    "get_item_stats": lambda owner, ids: select(UserItemStats).where(
+        UserItemStats.user_id == owner
+    ),
+    "get_item": lambda owner, ids: select(ScrapedItem)
+    .where(ScrapedItem.id == ids[0], ScrapedItem.owner_id == owner)
+    .limit(1),
+    "batch_get_items": lambda owner, ids: select(ScrapedItem).where(
+        ScrapedItem.owner_id == owner, ScrapedItem.id.in_(ids)
+    ),
+    "delete_item": lambda owner, ids: deleted_totals(
+        delete(ScrapedItem).where(
+            ScrapedItem.id == ids[0], ScrapedItem.owner_id == owner
+        )
+    ),
+    "ingest_items": lambda owner, ids: pg_insert(ScrapedItem)
+    .values(
+        [
+            {
+                "id": uuid.uuid4(),
+                "title": f"Benchmark Book {n}",
+                "url": f"https://books.toscrape.com/catalogue/bench-{n}/index.html",
+                "owner_id": owner,
+            }
+            for n in range(500)
+        ]
+    )
+    .on_conflict_do_nothing(index_elements=["owner_id", "url"]),
+}
+
+
+def _plan_shape(node: dict) -> str:
+    """Summarize a plan tree as ``Node (index) > Child > ...``."""
+    label = node["Node Type"]
+    if "Index Name" in node:
+        label += f" ({node['Index Name']})"
+    children = node.get("Plans") or []
+    if children:
+        label += " > " + ", ".join(_plan_shape(child) for child in children)
+    return label
+
+
+def _explain(conn, stmt) -> dict:
+    """Run EXPLAIN ANALYZE on a statement and return the JSON plan."""
+    sql = str(
+        stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    )
+    explain = "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + sql
+    row = conn.exec_driver_sql(explain).scalar_one()
+    return row[0] if isinstance(row, list) else json.loads(row)[0]
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def run(samples: int, prefix: str) -> dict:
+    """Explain every scenario for ``samples`` random seeded users."""
+    engine = get_engine()
+    with engine.connect() as conn:
+        owners = conn.execute(
+            select(User.id).where(User.username.startswith(prefix, autoescape=True))
+        ).scalars().all()
+        if not owners:
+            raise SystemExit(f"no users named {prefix}*; run benchmarks.seed first")
+        owners = random.Random(0).sample(owners, min(samples, len(owners)))
+        item_ids = {
+            owner: conn.execute(
+                select(ScrapedItem.id).where(ScrapedItem.owner_id == owner).limit(100)
+            ).scalars().all()
+            or [uuid.uuid4()]
+            for owner in owners
+        }
+        total_rows = conn.execute(text("SELECT count(*) FROM scraped_items")).scalar_one()
+        indexes = conn.execute(
+            text(
+                "SELECT indexrelname, pg_relation_size(indexrelid), idx_scan "
+                "FROM pg_stat_user_indexes WHERE relname = 'scraped_items' "
+                "ORDER BY indexrelname"
+            )
+        ).all()
+
+    results = {
+        "rows": total_rows,
+        "indexes": {name: {"bytes": size, "scans": scans} for name, size, scans in indexes},
+        "scenarios": {},
+    }
+    for name, build in SCENARIOS.items():
+        times, buffers, shape = [], [], None
+        for owner in owners:
+            with engine.connect() as conn:
+                trans = conn.begin()
+                try:
+                    plan = _explain(conn, build(owner, item_ids[owner]))
+                finally:
+                    trans.rollback()
+            times.append(plan["Execution Time"])
+            top = plan["Plan"]
+            buffers.append(top.get("Shared Hit Blocks", 0) + top.get("Shared Read Blocks", 0))
+            shape = shape or _plan_shape(top)
+        results["scenarios"][name] = {
+            "median_ms": statistics.median(times),
+            "p95_ms": _percentile(times, 0.95),
+            "buffers": statistics.median(buffers),
+            "plan": shape,
+        }
+    return results
+
+
+def report(results: dict) -> None:
+    """Print index sizes and per-scenario timings and plans."""
+    print(f"scraped_items: {results['rows']} rows")
+    for name, index in results["indexes"].items():
+        print(f"  {name:<42} {index['bytes'] / 2**20:8.1f} MB  scans={index['scans']}")
+    print()
+    for name, row in results["scenarios"].items():
+        print(
+            f"{name:<24} median {row['median_ms']:8.3f} ms  p95 {row['p95_ms']:8.3f} ms"
+            f"  buffers {row['buffers']:>8}"
+        )
+        print(f"  {row['plan']}")
+
+
+def compare(before: dict, after: dict) -> None:
+    """Print the median time and plan changes between two result files."""
+    print(f"{'scenario':<24} {'before ms':>10} {'after ms':>10} {'speedup':>8}")
+    for name, old in before["scenarios"].items():
+        new = after["scenarios"].get(name)
+        if new is None:
+            continue
+        speedup = old["median_ms"] / new["median_ms"] if new["median_ms"] else float("inf")
+        print(
+            f"{name:<24} {old['median_ms']:10.3f} {new['median_ms']:10.3f} {speedup:7.1f}x"
+        )
+        if old["plan"] != new["plan"]:
+            print(f"  before: {old['plan']}\n  after:  {new['plan']}")
+    old_size = sum(i["bytes"] for i in before["indexes"].values())
+    new_size = sum(i["bytes"] for i in after["indexes"].values())
+    print(f"\nindex size: {old_size / 2**20:.1f} MB -> {new_size / 2**20:.1f} MB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--samples", type=int, default=50)
+    parser.add_argument("--prefix", default="bench-")
+    parser.add_argument("--output")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"))
+    args = parser.parse_args()
+
+    if args.compare:
+        with open(args.compare[0]) as f1, open(args.compare[1]) as f2:
+            compare(json.load(f1), json.load(f2))
+        return
+
+    results = run(args.samples, args.prefix)
+    report(results)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Overhead benchmark for the API token-bucket rate limiter.
+
+Times ``take()`` on the in-process backend (and, with --postgres, on the
+Postgres backend using the configured database) across many user keys.
+
+Usage:
+    python -m benchmarks.rate_limit [--ops 200000] [--users 1000] [--postgres]
+"""
+
+import argparse
+import time
+
+from app.services.api_rate_limit import InMemoryBackend, PostgresBackend
+
+
+def bench(backend, ops: int, users: int) -> float:
+    """Return the mean microseconds per take() call."""
+    keys = [f"items:user-{i}" for i in range(users)]
+    start = time.perf_counter()
+    for i in range(ops):
+        backend.take(keys[i % users], 60, 2.0)
+    return (time.perf_counter() - start) / ops * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--ops", type=int, default=200_000)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--postgres", action="store_true")
+    args = parser.parse_args()
+
+    print(f"memory:   {bench(InMemoryBackend(), args.ops, args.users):.2f} us/op")
+    if args.postgres:
+        ops = min(args.ops, 5000)
+        print(f"postgres: {bench(PostgresBackend(), ops, args.users):.2f} us/op (n={ops})")
+
+
+if __name__ == "__main__":
+    main()
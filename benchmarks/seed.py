@@ -0,0 +1,144 @@
+"""
+Seed the configured database with a large synthetic dataset.
+
+Creates ``--users`` users named ``<prefix><n>`` with ``--items-per-user``
+scraped items each, streamed in with ``COPY`` so millions of rows load in
+minutes. Item fields follow the shape of the real catalogue (prices,
+stock, 1-5 star ratings, a few dozen categories, creation times spread
+over a year) so the planner sees realistic distributions. Tables are
+ANALYZEd afterwards and user_item_stats is rebuilt, since COPY bypasses
+the code that maintains it.
+
+By default every item gets its own URL, which loads on any schema
+revision. ``--shared-urls`` gives all users the same catalogue URLs, the
+way real users scraping the same site do; it needs the per-owner URL
+uniqueness introduced by the index tuning migration.
+
+Usage:
+    python -m benchmarks.seed [--users 2000] [--items-per-user 1000] [--shared-urls]
+    python -m benchmarks.seed --drop
+"""
+
+import argparse
+import csv
+import io
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from app.core.database import SessionLocal, get_engine
+from app.services.item_stats import rebuild_item_stats
+
+CATEGORIES = [f"Category {n}" for n in range(50)]
+PASSWORD_PLACEHOLDER = "!seeded-user-cannot-login"
+
+
+def _copy(cursor, table: str, columns: str, rows) -> None:
+    """Stream rows into ``table`` with COPY ... FROM STDIN (CSV)."""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    buffer.seek(0)
+    cursor.copy_expert(f"COPY {table} ({columns}) FROM STDIN WITH (FORMAT csv)", buffer)
+
+
+def _items(owner_id: uuid.UUID, count: int, shared_urls: bool, rng: random.Random):
+    """Yield CSV rows of synthetic items for one owner."""
+    now = datetime.now(timezone.utc)
+    for n in range(count):
+        slug = f"book-{n}" if shared_urls else f"book-{owner_id.hex[:12]}-{n}"
+        yield (
+            uuid.uuid4(),
+            f"Synthetic Book {n}",
+            "Lorem ipsum " * rng.randint(5, 80),
+            f"https://books.toscrape.com/catalogue/{slug}/index.html",
+            (now - timedelta(seconds=rng.randint(0, 365 * 86400))).isoformat(),
+            f"{rng.uniform(5, 60):.2f}",
+            0 if rng.random() < 0.1 else rng.randint(1, 25),
+            rng.randint(1, 5),
+            f"{rng.getrandbits(64):016x}",
+            CATEGORIES[n % len(CATEGORIES)],
+            owner_id,
+        )
+
+
+def seed(
+    users: int, items_per_user: int, prefix: str, shared_urls: bool, rng_seed: int
+) -> None:
+    """Insert the synthetic users and items, committing per batch of users."""
+    rng = random.Random(rng_seed)
+    conn = get_engine().raw_connection()
+    started = time.perf_counter()
+    try:
+        cursor = conn.cursor()
+        batch = max(1, 50_000 // max(1, items_per_user))
+        for first in range(0, users, batch):
+            owners = [uuid.uuid4() for _ in range(min(batch, users - first))]
+            _copy(
+                cursor,
+                "users",
+                "id, username, hashed_password, items_version",
+                (
+                    (owner, f"{prefix}{first + i}", PASSWORD_PLACEHOLDER, 1)
+                    for i, owner in enumerate(owners)
+                ),
+            )
+            for owner in owners:
+                _copy(
+                    cursor,
+                    "scraped_items",
+                    "id, title, description, url, created_at, price, stock, "
+                    "rating, upc, category, owner_id",
+                    _items(owner, items_per_user, shared_urls, rng),
+                )
+            conn.commit()
+            done = first + len(owners)
+            print(f"{done}/{users} users, {done * items_per_user} items", flush=True)
+
+        conn.autocommit = True
+        cursor.execute("ANALYZE users")
+        cursor.execute("ANALYZE scraped_items")
+    finally:
+        conn.close()
+    with SessionLocal() as db:
+        rebuild_item_stats(db)
+    print(f"seeded in {time.perf_counter() - started:.1f} s")
+
+
+def drop(prefix: str) -> None:
+    """Delete the seeded users and their items."""
+    conn = get_engine().raw_connection()
+    try:
+        cursor = conn.cursor()
+        like = prefix.replace("%", r"\%").replace("_", r"\_") + "%"
+        cursor.execute(
+            "DELETE FROM scraped_items WHERE owner_id IN "
+            "(SELECT id FROM users WHERE username LIKE %s)",
+            (like,),
+        )
+        items = cursor.rowcount
+        cursor.execute("DELETE FROM users WHERE username LIKE %s", (like,))
+        conn.commit()
+        print(f"deleted {cursor.rowcount} users and {items} items")
+    finally:
+        conn.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--items-per-user", type=int, default=1000)
+    parser.add_argument("--prefix", default="bench-")
+    parser.add_argument("--shared-urls", action="store_true")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--drop", action="store_true")
+    args = parser.parse_args()
+
+    if args.drop:
+        drop(args.prefix)
+    else:
+        seed(args.users, args.items_per_user, args.prefix, args.shared_urls, args.seed)
+
+
+if __name__ == "__main__":
+    main()
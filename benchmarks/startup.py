@@ -0,0 +1,101 @@
+"""
+Startup benchmark for the Web Scraper API.
+
+Measures, in fresh interpreters:
+- import time of ``app.main`` and which heavy dependencies it pulls in;
+- time-to-first-request: from spawning uvicorn until ``GET /docs`` answers.
+
+No database connection is needed; the engine is created but not connected.
+
+Usage:
+    python -m benchmarks.startup [--runs 5] [--port 8765]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+HEAVY_MODULES = ["bs4", "requests", "passlib", "bcrypt", "jose", "psycopg2"]
+
+IMPORT_SNIPPET = f"""
+import sys, time
+t = time.perf_counter()
+import app.main
+elapsed = time.perf_counter() - t
+loaded = [m for m in {HEAVY_MODULES!r} if m in sys.modules]
+print(elapsed, ",".join(loaded))
+"""
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure_import(runs: int) -> None:
+    """Print import-time statistics for ``app.main``."""
+    times = []
+    loaded = ""
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", IMPORT_SNIPPET],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split()
+        times.append(float(out[0]) * 1000)
+        loaded = out[1] if len(out) > 1 else ""
+    print(
+        f"import app.main: min={min(times):.1f} ms "
+        f"median={statistics.median(times):.1f} ms (n={runs})"
+    )
+    print(f"heavy modules loaded at import: {loaded or 'none'}")
+
+
+def measure_first_request(runs: int, port: int) -> None:
+    """Print time-to-first-request statistics for a fresh uvicorn process."""
+    url = f"http://127.0.0.1:{port}/docs"
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        proc = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port)],
+            cwd=ROOT,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            while True:
+                if proc.poll() is not None:
+                    raise RuntimeError("uvicorn exited before serving a request")
+                try:
+                    with urllib.request.urlopen(url, timeout=1) as r:
+                        r.read()
+                    break
+                except (urllib.error.URLError, ConnectionError):
+                    time.sleep(0.01)
+            times.append((time.perf_counter() - start) * 1000)
+        finally:
+            proc.terminate()
+            proc.wait()
+    print(
+        f"time-to-first-request: min={min(times):.1f} ms "
+        f"median={statistics.median(times):.1f} ms (n={runs})"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    measure_import(args.runs)
+    measure_first_request(args.runs, args.port)
+
+
+if __name__ == "__main__":
+    main()
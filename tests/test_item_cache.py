@@ -0,0 +1,51 @@
+"""
+ItemsCache stays within its entry and byte budgets.
+
+Run with ``python -m unittest discover tests``; no database is needed.
+"""
+
+import unittest
+
+from app.services.item_cache import ItemsCache
+
+
+class ItemsCacheTest(unittest.TestCase):
+    def test_evicts_least_recently_used_to_fit_bytes(self):
+        cache = ItemsCache(maxsize=100, max_bytes=100)
+        cache.set("a", b"x" * 40)
+        cache.set("b", b"x" * 40)
+        cache.get("a")
+        cache.set("c", b"x" * 40)
+
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("c"))
+        self.assertEqual(cache.bytes, 80)
+
+    def test_body_larger_than_budget_is_not_cached(self):
+        cache = ItemsCache(maxsize=100, max_bytes=100)
+        cache.set("small", b"x" * 10)
+        cache.set("huge", b"x" * 101)
+
+        self.assertIsNone(cache.get("huge"))
+        self.assertIsNotNone(cache.get("small"))
+        self.assertEqual(cache.bytes, 10)
+
+    def test_replacing_a_key_updates_byte_count(self):
+        cache = ItemsCache(maxsize=100, max_bytes=100)
+        cache.set("a", b"x" * 60)
+        cache.set("a", b"x" * 20)
+
+        self.assertEqual(cache.bytes, 20)
+
+    def test_entry_count_still_bounds_cache(self):
+        cache = ItemsCache(maxsize=2, max_bytes=1000)
+        for key in "abc":
+            cache.set(key, b"x")
+
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.bytes, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
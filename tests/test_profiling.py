@@ -0,0 +1,68 @@
+"""
+Opt-in profiling captures the endpoint it profiles.
+
+Run with ``python -m unittest discover tests``; no database is needed.
+"""
+
+import os
+import pstats
+import tempfile
+import unittest
+import uuid
+from types import SimpleNamespace
+
+PROFILE_DIR = tempfile.mkdtemp(prefix="profiles-")
+os.environ.update(
+    SECRET_KEY="test-secret",
+    PROFILE_ADMIN_TOKEN="profile-token",
+    PROFILE_DIR=PROFILE_DIR,
+    PROFILER="cprofile",
+    RATE_LIMIT_ENABLED="0",
+)
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.core.config import get_settings  # noqa: E402
+from app.main import app  # noqa: E402
+from app.routes.book_scraper import get_items_read_db  # noqa: E402
+from app.services.auth_service import get_current_user  # noqa: E402
+
+
+class _NoStatsSession:
+    def get(self, model, key):
+        return None
+
+
+class ProfiledRouteTest(unittest.TestCase):
+    def setUp(self):
+        get_settings.cache_clear()
+        user = SimpleNamespace(id=uuid.uuid4(), username="profiled")
+        app.dependency_overrides[get_current_user] = lambda: user
+        app.dependency_overrides[get_items_read_db] = lambda: _NoStatsSession()
+        self.client = TestClient(app)
+
+    def tearDown(self):
+        app.dependency_overrides.clear()
+        get_settings.cache_clear()
+
+    def test_endpoint_wrapped_once(self):
+        route = next(r for r in app.routes if getattr(r, "path", "") == "/items/stats")
+        self.assertFalse(hasattr(route.endpoint.__wrapped__, "__wrapped__"))
+
+    def test_saved_profile_contains_endpoint(self):
+        response = self.client.get("/items/stats", headers={"X-Profile": "profile-token"})
+        self.assertEqual(response.status_code, 200)
+        name = response.headers["X-Profile-Id"]
+
+        stats = pstats.Stats(os.path.join(PROFILE_DIR, name))
+        functions = {func for _, _, func in stats.stats}
+        self.assertIn("get_item_stats", functions)
+
+    def test_unrequested_request_is_not_profiled(self):
+        response = self.client.get("/items/stats")
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("X-Profile-Id", response.headers)
+
+
+if __name__ == "__main__":
+    unittest.main()